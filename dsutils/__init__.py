@@ -0,0 +1,25 @@
+"""Init dsutils
+
+Subpackages are imported on first access. On Python 3.6, which has no
+module __getattr__, they must be imported explicitly, e.g.
+`import dsutils.utils`
+"""
+import importlib
+
+_SUBMODULES = [
+    'config',
+    'monitoring',
+    'style',
+    'transformers',
+    'utils',
+]
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
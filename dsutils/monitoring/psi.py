@@ -43,10 +43,16 @@ def _psi(e : np.ndarray, o : np.ndarray, k = 1e-6):
     psi = np.dot((o - e) , np.log(o / e))
     return psi
 
-def _get_frequencies(df : pd.DataFrame = None, cols : list = None):
+def _get_frequencies(df : pd.DataFrame = None, cols : list = None,
+                     summaries : dict = None):
+    if summaries is None:
+        summaries = {}
     dist = {}
     for c in cols:
-        d = df.loc[:,c].value_counts(normalize = True, dropna = False).to_dict()
+        if c in summaries:
+            d = summaries[c].frequencies(dropna = False)
+        else:
+            d = df.loc[:,c].value_counts(normalize = True, dropna = False).to_dict()
         dist[c] = d
     return dist
 
@@ -64,18 +70,24 @@ class PSI:
         self._cols = None
         self._dist = None
 
-    def fit(self, df : pd.DataFrame = None, variables : Union[str,list] = None):
+    def fit(self, df : pd.DataFrame = None, variables : Union[str,list] = None,
+            summaries : dict = None):
         """Fit method
         Parameters
         ----------
         df : pandas.DataFrame
 
         variables : Union[str,list]
+
+        summaries : dict
+            Optional `dsutils.utils.binners.ColumnSummary` of numeric
+            columns of `df`, keyed by column name. The frequencies of
+            these columns are read from the summaries
         """
         df = df.copy()
         cols = _validate_variables(df, variables)
         self._cols = cols
-        self._dist = _get_frequencies(df, cols)
+        self._dist = _get_frequencies(df, cols, summaries)
 
     def transform(self, df : pd.DataFrame):
         df = df.copy()
@@ -1,7 +1,10 @@
-"""Init transformers"""
-from ._categorical_binners import MaxLevelBinner
-from ._categorical_binners import PercentThresholdBinner
-from ._categorical_binners import CumulativePercentThresholdBinner
+"""Init transformers
+
+The transformers are imported on first access, so that importing
+dsutils.transformers does not import sklearn and feature_engine
+"""
+import sys
+import importlib
 
 #from ._numeric_transformers import OutlierPercentileCapper
 
@@ -11,7 +14,36 @@ __all__ = [
     # from _categorical_binners
     'MaxLevelBinner',
     'PercentThresholdBinner',
-    'CumulativePercentThresholdBinner'
+    'CumulativePercentThresholdBinner',
+    # from _numeric_binners
+    'NumericBinner',
     # _numeric_transformers
     #'OutlierPercentileCapper',
-]
\ No newline at end of file
+]
+
+_SUBMODULES = {
+    'MaxLevelBinner': '._categorical_binners',
+    'PercentThresholdBinner': '._categorical_binners',
+    'CumulativePercentThresholdBinner': '._categorical_binners',
+    'NumericBinner': '._numeric_binners',
+}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        value = getattr(importlib.import_module(_SUBMODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ (PEP 562) requires Python 3.7
+    from ._categorical_binners import MaxLevelBinner
+    from ._categorical_binners import PercentThresholdBinner
+    from ._categorical_binners import CumulativePercentThresholdBinner
+    from ._numeric_binners import NumericBinner
@@ -0,0 +1,84 @@
+"""
+Module of numeric binners
+"""
+
+from typing import Union, Optional, List
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, TransformerMixin
+from feature_engine.dataframe_checks import _is_dataframe
+from feature_engine.variable_manipulation import (
+    _check_input_parameter_variables,
+    _find_or_check_numerical_variables
+)
+from ..utils.binners import _fit_bins, _bin_layout, _bin_codes
+
+
+class NumericBinner(BaseEstimator, TransformerMixin):
+    """
+    NumericBinner
+
+    Bins numeric variables the same way as `dsutils.utils.binners.cutter`,
+    but constructs the bins once in `fit`. `transform` only looks up the
+    stored bin endpoints, so values outside the range seen in `fit` are
+    treated as missing
+    """
+    def __init__(self, variables: Union[None, int, str, List[Union[str, int]]] = None,
+                 max_levels = 20, point_mass_threshold = 0.1, sig_fig = 3,
+                 qntl_cutoff = [0.025,0.975], cuts = 'linear'): # pylint: disable=dangerous-default-value
+        self.variables = _check_input_parameter_variables(variables)
+        self.max_levels = max_levels
+        self.point_mass_threshold = point_mass_threshold
+        self.sig_fig = sig_fig
+        self.qntl_cutoff = qntl_cutoff
+        self.cuts = cuts
+
+    def fit(self, X, y : Optional[pd.Series] = None): # pylint: disable=unused-argument
+        """
+        Fit method
+
+        Parameters
+        ----------
+        X : pandas.DataFrame
+        """
+        self.map = {} # pylint: disable=attribute-defined-outside-init
+        X = _is_dataframe(X)
+        self.variables = _find_or_check_numerical_variables(X, self.variables)
+        for z in self.variables:
+            b, pm, bin_labels, pm_labels = _fit_bins(
+                X[z],
+                max_levels = self.max_levels,
+                point_mass_threshold = self.point_mass_threshold,
+                sig_fig = self.sig_fig,
+                qntl_cutoff = self.qntl_cutoff,
+                cuts = self.cuts)
+            labels, edge_codes, bin_codes = _bin_layout(
+                b, pm, bin_labels, pm_labels)
+            self.map[z] = {
+                'edges': b,
+                'point_masses': pm,
+                'labels': labels,
+                'edge_codes': edge_codes,
+                'bin_codes': bin_codes}
+        return self
+
+    def transform(self, X : pd.DataFrame):
+        """
+        Transform method
+
+        Parameters
+        ----------
+        X : pandas.DataFrame
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        X = _is_dataframe(X).copy()
+        for z in self.variables:
+            m = self.map[z]
+            codes = _bin_codes(
+                np.asarray(X[z].values, dtype=float),
+                m['edges'], m['edge_codes'], m['bin_codes'])
+            X[z] = pd.Categorical.from_codes(codes, categories=m['labels'])
+        return X
@@ -0,0 +1,29 @@
+"""Init utils
+
+Submodules are imported on first access, so that importing one of them
+does not import the plotting and scipy dependencies of the others. On
+Python 3.6, which has no module __getattr__, they must be imported
+explicitly, e.g. `import dsutils.utils.binners`
+"""
+import importlib
+
+_SUBMODULES = [
+    'binners',
+    'cache',
+    'cardinality',
+    'dates',
+    'formatters',
+    'histogram_tables',
+    'histograms',
+    'stats',
+]
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
@@ -3,10 +3,12 @@ Binner functions for grouping numeric variables into
 bins
 """
 
+import os
 import re
 import math
 import numpy as np
 import pandas as pd
+from .cache import cached
 
 
 def cutpoints(
@@ -21,8 +23,8 @@ def cutpoints(
 
     Parameters
     ----------
-    x : numpy 1-D array
-        numeric 1-D array
+    x : numpy 1-D array, QuantileSketch or ColumnSummary
+        numeric 1-D array, or a summary of one
 
     qntl_cutoff : list
         list of length two with lower and upper quantile cutoffs:
@@ -52,12 +54,12 @@ def cutpoints(
     '''
 
     # Create lower bound:
-    lb = np.nanmin(x)
+    lb = _nanmin(x)
     lb_ord_of_mag = _order_of_mag(lb)
     lb_pwr = sig_fig - 1 - lb_ord_of_mag
     lb = np.floor(lb * 10**lb_pwr) / 10**lb_pwr
     # Create upper bound:
-    ub = np.nanmax(x)
+    ub = _nanmax(x)
     ub_ord_of_mag = _order_of_mag(ub)
     ub_pwr = sig_fig - 1 - ub_ord_of_mag
     ub = np.ceil(ub * 10**ub_pwr) / 10**ub_pwr
@@ -67,7 +69,7 @@ def cutpoints(
             len(qntl_cutoff) == 2 and
             isinstance(qntl_cutoff[0],float) and
             isinstance(qntl_cutoff[1],float)):
-        ep = np.quantile(x, qntl_cutoff)
+        ep = _quantile(x, qntl_cutoff)
     else:
         ep = np.array([lb,ub])
 
@@ -94,7 +96,7 @@ def cutpoints(
                 )
             c = np.sort(np.unique(np.append(0,c)))
         elif cuts == 'quantile':
-            c = np.quantile(x,np.linspace(0,1,ncuts))
+            c = _quantile(x,np.linspace(0,1,ncuts))
     else:
         # cuts are the actual cut points themselves
         c = cuts
@@ -102,7 +104,7 @@ def cutpoints(
     # add far endpoints to c:
     c = np.unique(np.append(np.append(lb,c),ub))
     # round/format values in c:
-    c_ord_of_mag = np.array([_order_of_mag(i) for i in c])
+    c_ord_of_mag = _orders_of_mag(c)
     c_log_rnd = np.round(c / 10.0**c_ord_of_mag, sig_fig - 1)
     c_final = np.unique(c_log_rnd * (10.0**c_ord_of_mag))
     return c_final
@@ -167,7 +169,7 @@ def human_readable_num(number, sig_fig=3, **kwargs):
 
 def cutter(
     df, x, max_levels=20, point_mass_threshold=0.1,
-    sig_fig=3, **kwargs):
+    sig_fig=3, sketch=None, **kwargs):
     """
     Cut a numeric variable into bins
 
@@ -189,72 +191,100 @@ def cutter(
     sig_fig : int
         Significant figures to use in binning
 
+    sketch : QuantileSketch or ColumnSummary
+        Optional summary of 'x' to construct the bins from instead of
+        df[x], e.g. a sketch built over all chunks of a larger data set
+        so that every chunk is binned the same way, or a ColumnSummary
+        reused across several analyses of the same column
+
     Returns
     -------
     z : pandas.Series
         Categorical series of binned values
     """
 
-    df = df.loc[:,[x]].copy()
+    codes, final_labels = _cutter_codes(
+        df[x].values,
+        max_levels=max_levels,
+        point_mass_threshold=point_mass_threshold,
+        sig_fig=sig_fig,
+        sketch=sketch,
+        **kwargs)
 
-    # pm contains any values that exceed point_mass_threshold
-    # pm is 1-D numpy.array
-    pm = _point_mass(df[x], threshold = point_mass_threshold)
+    # Apply labels
+    z = pd.Categorical.from_codes(codes, categories = final_labels)
+    return z
 
-    if len(pm) == 0:
-        # if there are no values exceeding point_mass_threshold
-        # proceed as usual
-        x_no_nan = ~np.isnan(df.loc[:,x].values)
-        cps = cutpoints(
-            df.loc[x_no_nan,x].values,
-            ncuts = max_levels,
-            **kwargs)
 
-    elif len(pm) > 0:
-        # if there are values exceeding point_mass_threshold
-        # put all remaining values in rem
-        rem = df.loc[~df[x].isin(pm),[x]]
-        x_no_nan = ~np.isnan(rem.loc[:,x].values)
-        if len(rem.loc[x_no_nan,x].values) > 0:
-            # apply cutpoints to rem if there are non-NaN
-            # values
-            cps = cutpoints(
-                rem.loc[x_no_nan,x].values,
-                ncuts = max_levels, # - len(pm),
-                **kwargs)
-        else:
-            # Otherwise, rem has no non-NaN values and
-            # we just generate empty cutpoints
-            cps = np.array([])
+def cutter_many(
+    df, columns=None, max_levels=20, point_mass_threshold=0.1,
+    sig_fig=3, n_jobs=None, **kwargs):
+    """
+    Cut several numeric variables into bins
 
-    # Construct bin_labels and pm_labels
-    c_final, bin_labels, pm_labels = _finalize_bins(cps,pm,sig_fig=sig_fig)
+    Parameters
+    ----------
+    df : pandas.DataFrame
+
+    columns : list
+        the names of the numeric variables in 'df' to construct
+        bins from. If None, use all numeric columns
+
+    max_levels : int
+        maximum number of bins to create from each variable
 
-    # Bin values
-    df.loc[~df[x].isin(pm),x + '_BINNED'] = pd.cut(
-        df.loc[~df[x].isin(pm),x].values,
-        c_final,
-        labels=bin_labels,
-        include_lowest=True)
+    point_mass_threshold : float
+        Levels with frequency greater than point_mass_threshold
+        get their own bin
 
-    # Bring in point masses
-    for i,v in enumerate(pm):
-        df.loc[df[x] == v,x + '_BINNED'] = pm_labels[i]
+    sig_fig : int
+        Significant figures to use in binning
 
-    # Construct final labels
-    final_labels = bin_labels+pm_labels
-    final_labels.sort()
+    n_jobs : int
+        Number of worker processes to bin the columns with. If None
+        or 1, bin in the current process. If -1, use all CPUs.
+        Workers read the values from shared memory, which requires
+        Python 3.8 or later
 
-    # Apply labels
-    z = pd.Categorical(
-        df.loc[:,x + '_BINNED'].values,
-        categories = final_labels)
+    Returns
+    -------
+    z : pandas.DataFrame
+        Categorical binned values of each variable in 'columns'
+    """
+    if columns is None:
+        columns = df.select_dtypes('number').columns.tolist()
+    elif isinstance(columns, str):
+        columns = [columns]
+
+    params = dict(
+        max_levels=max_levels,
+        point_mass_threshold=point_mass_threshold,
+        sig_fig=sig_fig,
+        **kwargs)
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+    if n_jobs is None or n_jobs <= 1 or len(columns) <= 1:
+        res = [
+            _cutter_codes(
+                np.ascontiguousarray(df[c].values, dtype=float),
+                **params)
+            for c in columns]
+    else:
+        res = _cutter_codes_parallel(df, columns, n_jobs, params)
+
+    z = pd.DataFrame(
+        {c: pd.Categorical.from_codes(codes, categories = labels)
+         for c, (codes, labels) in zip(columns, res)},
+        index = df.index,
+        columns = columns)
     return z
 
 
 def binner_df(
     df, x, new_col=None,
-    fill_nan="MISSING", max_levels=20, **kwargs):
+    fill_nan="MISSING", max_levels=20,
+    inplace=False, return_column=False, **kwargs):
     """
     Bin a numeric variable
 
@@ -270,22 +300,396 @@ def binner_df(
         Use as the name of the binned variable
 
     fill_nan : str
-        Value to fill nans with
+        Value to fill nans with, added as a category
 
     max_levels : int
         Maximum number of bins to create from 'x'
 
+    inplace : Boolean
+        If True, add the binned column to 'df' instead of
+        to a copy of it and return None
+
+    return_column : Boolean
+        If True, return only the binned column and leave 'df'
+        unchanged
+
     Returns
     ---------------------------
-    pandas.DataFrame including new binned column
+    pandas.DataFrame including new binned column, the binned
+    column as a categorical pandas.Series if return_column is True,
+    or None if inplace is True
     """
     if new_col is None:
         new_col = x
-    df_ = df.copy().assign(
-        **{new_col: lambda z: cutter(z, x, max_levels, **kwargs)})
+    z = pd.Series(
+        cutter(df, x, max_levels, **kwargs),
+        index=df.index,
+        name=new_col)
+    if fill_nan is not None:
+        z = _fill_nan_category(z, fill_nan)
+    if return_column:
+        return z
+    if inplace:
+        df[new_col] = z
+        return None
+    return df.assign(**{new_col: z})
+
+
+def binner_df_many(
+    df, columns=None, new_cols=None,
+    fill_nan="MISSING", max_levels=20, n_jobs=None,
+    inplace=False, return_column=False, **kwargs):
+    """
+    Bin several numeric variables
+
+    Parameters
+    --------------------------
+    df : pandas.DataFrame
+
+    columns : list
+        The names of the numeric variables in 'df' to
+        construct bins from. If None, use all numeric columns
+
+    new_cols : list
+        Use as the names of the binned variables
+
+    fill_nan : str
+        Value to fill nans with, added as a category
+
+    max_levels : int
+        Maximum number of bins to create from each variable
+
+    n_jobs : int
+        Number of worker processes, see `cutter_many`
+
+    inplace : Boolean
+        If True, add the binned columns to 'df' instead of
+        to a copy of it and return None
+
+    return_column : Boolean
+        If True, return only the binned columns and leave 'df'
+        unchanged
+
+    Returns
+    ---------------------------
+    pandas.DataFrame including new binned columns, only the binned
+    columns if return_column is True, or None if inplace is True
+    """
+    z = cutter_many(df, columns, max_levels, n_jobs=n_jobs, **kwargs)
+    if new_cols is not None:
+        z.columns = new_cols
     if fill_nan is not None:
-        df_.replace({new_col: {np.nan: fill_nan}}, inplace=True)
-    return df_
+        for c in z.columns:
+            z[c] = _fill_nan_category(z[c], fill_nan)
+    if return_column:
+        return z
+    if inplace:
+        for c in z.columns:
+            df[c] = z[c]
+        return None
+    return df.assign(**{c: z[c] for c in z.columns})
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch of a numeric variable
+
+    A KLL sketch: values are kept in compactors of increasing weight,
+    and a full compactor passes every other one of its sorted values to
+    the next, so memory stays bounded by roughly 3 * k values however
+    many values are added. Sketches built on separate chunks of data can
+    be merged. The smallest and largest distinct values are tracked
+    exactly, so that the bins constructed from the sketch always cover
+    the data. Until a compaction happens the sketch is exact.
+
+    Can be passed to `cutpoints` in place of an array, or to `cutter`
+    as 'sketch'
+
+    Parameters
+    ----------
+    k : int
+        Capacity of the top compactor, controls the accuracy: the rank
+        error of quantiles is roughly 1.7 / k
+
+    seed : int
+        Seed for the random choices made during compaction
+
+    n_extremes : int
+        Number of smallest and largest distinct values to keep exactly
+    """
+    def __init__(self, k=200, seed=None, n_extremes=16):
+        self.k = k
+        self.n_extremes = n_extremes
+        self.n = 0
+        self.n_nan = 0
+        self._levels = [np.empty(0)]
+        self._lo = np.empty(0)
+        self._hi = np.empty(0)
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, x):
+        """
+        Add values to the sketch
+
+        Parameters
+        ----------
+        x : 1-D array-like
+            numeric values, NaNs are counted but otherwise ignored
+
+        Returns
+        -------
+        self
+        """
+        x = np.asarray(x, dtype=float).ravel()
+        is_nan = np.isnan(x)
+        self.n_nan += int(is_nan.sum())
+        x = np.sort(x[~is_nan])
+        if len(x) == 0:
+            return self
+        self.n += len(x)
+        distinct = x[np.concatenate([[True], x[1:] != x[:-1]])]
+        self._update_extremes(distinct[:self.n_extremes],
+                              distinct[-self.n_extremes:])
+        self._levels[0] = np.concatenate([self._levels[0], x])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """
+        Merge another sketch into this one
+
+        Parameters
+        ----------
+        other : QuantileSketch
+
+        Returns
+        -------
+        self
+        """
+        self.n += other.n
+        self.n_nan += other.n_nan
+        for h, lvl in enumerate(other._levels):
+            if h == len(self._levels):
+                self._levels.append(np.empty(0))
+            self._levels[h] = np.concatenate([self._levels[h], lvl])
+        self._update_extremes(other._lo, other._hi)
+        self._compress()
+        return self
+
+    def min(self):
+        """Smallest value added to the sketch"""
+        return self._lo[0] if self.n > 0 else np.nan
+
+    def max(self):
+        """Largest value added to the sketch"""
+        return self._hi[-1] if self.n > 0 else np.nan
+
+    def quantile(self, q):
+        """
+        Approximate quantiles, interpolated like `numpy.quantile`
+
+        Parameters
+        ----------
+        q : float or 1-D array-like of floats in [0, 1]
+
+        Returns
+        -------
+        float or 1-D numpy array
+        """
+        items, cw = self._weighted_items()
+        q = np.asarray(q, dtype=float)
+        r = q * (cw[-1] - 1)
+        j = np.floor(r)
+        lo = items[np.searchsorted(cw, j, side='right')]
+        hi = items[np.searchsorted(cw, np.minimum(j + 1, cw[-1] - 1), side='right')]
+        z = lo + (r - j) * (hi - lo)
+        z = np.where(q <= 0, self.min(), np.where(q >= 1, self.max(), z))
+        return z[()] if z.ndim == 0 else z
+
+    def point_masses(self, threshold=0.1):
+        """
+        Approximate point masses
+
+        Parameters
+        ----------
+        threshold : float
+            If value frequency exceeds threshold, consider value to have
+            point mass
+
+        Returns
+        -------
+        1-D numpy array that contains the point masses
+        """
+        items = np.concatenate(self._levels)
+        if len(items) == 0:
+            return items
+        v, idx = np.unique(items, return_inverse=True)
+        w = np.bincount(idx, weights=self._weights())
+        return v[w / self.n > threshold]
+
+    def _weights(self):
+        return np.concatenate(
+            [np.full(len(lvl), 2.0**h) for h, lvl in enumerate(self._levels)])
+
+    def _weighted_items(self):
+        items = np.concatenate(self._levels)
+        w = self._weights()
+        order = np.argsort(items, kind='mergesort')
+        return items[order], np.cumsum(w[order])
+
+    def _capacity(self, h):
+        depth = len(self._levels) - 1 - h
+        return max(2, int(np.ceil(self.k * (2 / 3)**depth)))
+
+    def _compress(self):
+        h = 0
+        while h < len(self._levels):
+            lvl = self._levels[h]
+            if len(lvl) <= self._capacity(h):
+                h += 1
+                continue
+            if h + 1 == len(self._levels):
+                self._levels.append(np.empty(0))
+            lvl = np.sort(lvl)
+            # with an odd number of values, one stays at this level
+            odd = len(lvl) % 2
+            promoted = lvl[odd + self._rng.integers(2)::2]
+            self._levels[h] = lvl[:odd]
+            self._levels[h + 1] = np.concatenate(
+                [self._levels[h + 1], promoted])
+            # adding a level lowers the capacity of the levels below it
+            h = 0
+
+    def _update_extremes(self, lo, hi):
+        m = self.n_extremes
+        self._lo = np.unique(np.concatenate([self._lo, lo]))[:m]
+        self._hi = np.unique(np.concatenate([self._hi, hi]))[-m:]
+
+    def _without(self, values):
+        """Approximate sketch of the values not in 'values'"""
+        z = QuantileSketch(k=self.k, n_extremes=self.n_extremes)
+        z._rng = self._rng
+        z._levels = []
+        removed = 0.0
+        for h, lvl in enumerate(self._levels):
+            keep = ~np.isin(lvl, values)
+            removed += (len(lvl) - keep.sum()) * 2.0**h
+            z._levels.append(lvl[keep])
+        z.n = int(round(self.n - removed))
+        z._lo = self._lo[~np.isin(self._lo, values)]
+        z._hi = self._hi[~np.isin(self._hi, values)]
+        if z.n > 0 and (len(z._lo) == 0 or len(z._hi) == 0):
+            # every tracked extreme is a removed value
+            items = np.concatenate(z._levels)
+            z._lo = items[[np.argmin(items)]] if len(z._lo) == 0 else z._lo
+            z._hi = items[[np.argmax(items)]] if len(z._hi) == 0 else z._hi
+        return z
+
+
+class ColumnSummary:
+    """
+    Sorted summary of a numeric variable
+
+    Sorts the non-NaN values once, so that the minimum, maximum,
+    quantiles and point masses are lookups rather than new passes over
+    the data. Can be passed to `cutpoints` in place of an array, to
+    `cutter` and `numeric_histogram` as 'sketch', and to
+    `dsutils.monitoring.psi.PSI.fit`
+
+    Parameters
+    ----------
+    x : 1-D array-like
+        numeric values
+    """
+    def __init__(self, x=None):
+        x = np.asarray([] if x is None else x, dtype=float).ravel()
+        is_nan = np.isnan(x)
+        self._set_sorted(np.sort(x[~is_nan]), int(is_nan.sum()))
+
+    def _set_sorted(self, s, n_nan):
+        self.sorted = s
+        self.n = len(s)
+        self.n_nan = n_nan
+        # run-length encode the sorted values
+        starts = np.flatnonzero(np.concatenate([[True], s[1:] != s[:-1]])) \
+            if self.n > 0 else np.empty(0, dtype=np.intp)
+        self.values = s[starts]
+        self.counts = np.diff(np.append(starts, self.n))
+
+    def min(self):
+        """Smallest non-NaN value"""
+        return self.sorted[0] if self.n > 0 else np.nan
+
+    def max(self):
+        """Largest non-NaN value"""
+        return self.sorted[-1] if self.n > 0 else np.nan
+
+    def quantile(self, q):
+        """
+        Quantiles, interpolated like `numpy.quantile`
+
+        Parameters
+        ----------
+        q : float or 1-D array-like of floats in [0, 1]
+
+        Returns
+        -------
+        float or 1-D numpy array
+        """
+        q = np.asarray(q, dtype=float)
+        r = q * (self.n - 1)
+        lo = np.floor(r).astype(np.intp)
+        hi = np.minimum(lo + 1, self.n - 1)
+        # interpolate between the neighbouring values with numpy.quantile
+        # itself, so results match it exactly across numpy versions
+        z = np.array([
+            np.quantile(self.sorted[[i, j]], t)
+            for i, j, t in zip(lo.ravel(), hi.ravel(), (r - lo).ravel())])
+        return z[0] if q.ndim == 0 else z
+
+    def point_masses(self, threshold=0.1):
+        """
+        Point masses
+
+        Parameters
+        ----------
+        threshold : float
+            If value frequency exceeds threshold, consider value to have
+            point mass
+
+        Returns
+        -------
+        1-D numpy array that contains the point masses
+        """
+        if self.n == 0:
+            return self.values
+        return self.values[self.counts / self.n > threshold]
+
+    def frequencies(self, dropna=True):
+        """
+        Relative frequency of each value, like
+        pandas.Series.value_counts(normalize=True) but sorted by value
+
+        Parameters
+        ----------
+        dropna : Boolean
+            If False, include the frequency of NaN
+
+        Returns
+        -------
+        dict
+        """
+        n = self.n if dropna else self.n + self.n_nan
+        freq = dict(zip(self.values.tolist(), (self.counts / n).tolist()))
+        if not dropna and self.n_nan > 0:
+            freq[np.nan] = self.n_nan / n
+        return freq
+
+    def _without(self, values):
+        """Summary of the values not in 'values'"""
+        z = ColumnSummary()
+        z._set_sorted(self.sorted[~np.isin(self.sorted, values)], 0)
+        return z
 
 
 def _log_spcl(x):
@@ -330,6 +734,130 @@ def _order_of_mag(x):
     return ord_of_mag
 
 
+def _nanmin(x):
+    """Minimum of a numeric 1-D array or a summary of one"""
+    if isinstance(x, (QuantileSketch, ColumnSummary)):
+        return x.min()
+    return np.nanmin(x)
+
+
+def _nanmax(x):
+    """Maximum of a numeric 1-D array or a summary of one"""
+    if isinstance(x, (QuantileSketch, ColumnSummary)):
+        return x.max()
+    return np.nanmax(x)
+
+
+def _quantile(x, q):
+    """Quantiles of a numeric 1-D array or a summary of one"""
+    if isinstance(x, (QuantileSketch, ColumnSummary)):
+        return x.quantile(q)
+    return np.quantile(x, q)
+
+
+def _orders_of_mag(x):
+    """
+    Calculate the orders of magnitude of an array of numbers,
+    vectorized `_order_of_mag`
+
+    Parameters
+    ----------
+
+    x : 1-D numpy array
+
+    Returns
+    -------
+
+    1-D numpy array of int : orders of magnitude of x
+    """
+    a = np.abs(np.asarray(x, dtype=float))
+    z = _floor_log(a, 10)
+    return np.where(a == 0, 0, z).astype(int)
+
+
+def _floor_log(a, base):
+    """
+    Vectorized math.floor(math.log(a, base)) for an array of
+    non-negative numbers
+
+    Parameters
+    ----------
+
+    a : 1-D numpy array
+
+    base : int or float
+
+    Returns
+    -------
+
+    1-D numpy array of float, -inf where a is 0
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = np.log(a) / np.log(base)
+        # numpy's log can differ from math.log in the last bit, which only
+        # matters next to an integer: recompute those values with math.log
+        near = np.abs(z - np.round(z)) < 1e-9
+    z[near] = [math.log(v, base) for v in a[near]]
+    return np.floor(z)
+
+
+def _human_readable_nums(x, sig_fig=3):
+    """
+    Make an array of numbers aesthetically-pleasing, vectorized
+    `human_readable_num`
+
+    Parameters
+    ----------
+
+    x : 1-D numpy array
+        Numbers to format
+
+    sig_fig : int
+        Number of significant figures to print
+
+    Returns
+    -------
+
+    1-D numpy array of str
+    """
+    x = np.asarray(x, dtype=float)
+    a = np.abs(x)
+    num = x.copy()
+    prec = np.zeros(len(x), dtype=int)
+    unit = np.full(len(x), '', dtype='<U8')
+    mag10 = _floor_log(a, 10)
+    mag1000 = _floor_log(a, 1000.0)
+    with np.errstate(invalid='ignore'):
+        small = (a > 0) & (a < 1)
+        big = a >= 1
+        # 0.01 <= |x| < 1
+        m = small & (mag10 >= -2)
+        prec[m] = sig_fig - 1 - mag10[m]
+        # |x| < 0.01
+        m = small & (mag10 < -2)
+        num[m] = x[m] / 10.0**mag10[m]
+        prec[m] = sig_fig - 1
+        unit[m] = np.char.add('E', mag10[m].astype(int).astype(str))
+        # |x| >= 1
+        num[big] = x[big] / 1000.0**mag1000[big]
+        mb = mag1000[big].astype(int)
+        unit[big] = np.where(
+            mb > 5,
+            np.char.add('E', (3 * mb).astype(str)),
+            np.array(['', 'K', 'M', 'G', 'T', 'P'])[np.minimum(mb, 5)])
+        an = np.abs(num)
+        prec[big] = np.where(
+            an[big] < 10, sig_fig - 1,
+            np.where(an[big] < 100, sig_fig - 2, sig_fig - 3))
+    z = np.where(np.isnan(x), 'MISSING', '0').astype('<U32')
+    fmt = small | big
+    for p in np.unique(prec[fmt]):
+        m = fmt & (prec == p)
+        z[m] = np.char.mod('%.' + str(p) + 'f', num[m])
+    z[fmt] = _remove_trailing_zeros_array(z[fmt])
+    return np.char.add(z, unit)
+
+
 def _point_mass(x, threshold=0.1):
     """
     Find point masses in pandas.Series with frequency exceeding
@@ -338,7 +866,7 @@ def _point_mass(x, threshold=0.1):
     Parameters
     ----------
 
-    x : pandas.Series
+    x : pandas.Series, QuantileSketch or ColumnSummary
 
     threshold : float
         If value frequency exceeds threshold, consider value to have
@@ -349,6 +877,8 @@ def _point_mass(x, threshold=0.1):
 
     1-D numpy array that contains the point masses
     """
+    if isinstance(x, (QuantileSketch, ColumnSummary)):
+        return x.point_masses(threshold)
     cnts = x.value_counts(normalize=True)
     v = cnts[cnts > threshold].index.values
     v.sort()
@@ -376,6 +906,42 @@ def _remove_trailing_zeros(num_as_str):
     return num_as_str
 
 
+def _remove_trailing_zeros_array(nums_as_str):
+    """
+    Remove unnecessary trailing zeros from numbers, vectorized
+    `_remove_trailing_zeros`
+
+    Parameters
+    ----------
+
+    nums_as_str : 1-D numpy array of str
+        Numbers as str
+
+    Returns
+    -------
+
+    1-D numpy array of str
+    """
+    has_dot = np.char.find(nums_as_str, '.') >= 0
+    stripped = np.char.rstrip(np.char.rstrip(nums_as_str, '0'), '.')
+    return np.where(has_dot, stripped, nums_as_str)
+
+
+def _str_join(*arrays):
+    """
+    Element-wise concatenation of str and 1-D numpy arrays of str
+
+    Returns
+    -------
+
+    1-D numpy array of str
+    """
+    z = arrays[0]
+    for a in arrays[1:]:
+        z = np.char.add(z, a)
+    return np.asarray(z)
+
+
 def _remove_closest(x, y, exclude_endpoints=True, **kwargs):
     """
     Remove the elements of x that are closest to the elements of y.
@@ -385,6 +951,7 @@ def _remove_closest(x, y, exclude_endpoints=True, **kwargs):
     ----------
 
     x : 1-D numpy array
+        Sorted values
 
     y : 1-D numpy array
 
@@ -396,20 +963,20 @@ def _remove_closest(x, y, exclude_endpoints=True, **kwargs):
     numpy 1-D array : the elements of x after removing the values closest
         to the elements of y
     """
-    x = x.copy()
-    if len(x) > 2 or not exclude_endpoints:
-        if exclude_endpoints:
-            z = x[1:-1]
-        else:
-            z = x
-        r = range(len(z))
-        ridx = [min(r, key=lambda i: abs(z[i] - j)) + 1 for j in y]
-        ridx = list(set(ridx))
-        x = x.tolist()
-        for index in sorted(ridx, reverse=True):
-            del x[index]
-        x = np.array(x)
-    return x
+    x = np.asarray(x)
+    offset = 1 if exclude_endpoints else 0
+    z = x[offset:len(x) - offset]
+    if len(z) == 0 or len(y) == 0:
+        return x.copy()
+    # the closest element of z is one of the two neighbours of the
+    # insertion point, with ties going to the lower one
+    j = np.searchsorted(z, y, side='left')
+    lo = np.maximum(j - 1, 0)
+    hi = np.minimum(j, len(z) - 1)
+    ridx = np.where(np.abs(z[lo] - y) <= np.abs(z[hi] - y), lo, hi)
+    keep = np.ones(len(x), dtype=bool)
+    keep[ridx + offset] = False
+    return x[keep]
 
 
 def _finalize_bins(x, pm, sig_fig=3, **kwargs):
@@ -442,7 +1009,6 @@ def _finalize_bins(x, pm, sig_fig=3, **kwargs):
     """
     b = _remove_closest(x, pm, **kwargs)
     b = np.unique(np.concatenate([b, pm]))
-    b.sort()
     bin_labels, pm_labels = _label_constructor(
         b, pm, sig_fig=sig_fig, **kwargs)
     return b, bin_labels, pm_labels
@@ -473,22 +1039,333 @@ def _label_constructor(x, pm, sig_fig=3, **kwargs):
     pm_labels : list
         Labels for the point masses
     """
-    bin_labels = []
-    pm_labels = []
-    x_format = [human_readable_num(i, sig_fig=sig_fig) for i in x]
-    cntr = 0
-    for i in range(len(x)):
-        if x[i] in pm:
-            pm_labels.append(str(i+cntr+1).zfill(2) + ": " + x_format[i])
-            cntr += 1
-        if i < len(x) - 1:
-            bin_labels.append(
-                str(i + cntr + 1).zfill(2) +
-                ': ' +
-                ('[' if i == 0 and (x[i] not in pm) else '(') +
-                x_format[i] +
-                ', ' +
-                x_format[i+1] +
-                (']' if (x[i+1] not in pm) else ')')
-            )
-    return bin_labels, pm_labels
+    x = np.asarray(x, dtype=float)
+    if len(x) == 0:
+        return [], []
+    is_pm = np.isin(x, pm)
+    idx = np.arange(len(x))
+    # number labels in order, each point mass label before the bin
+    # to its right
+    num = np.char.zfill((idx + np.cumsum(is_pm)).astype(str), 2)
+    bin_num = np.char.zfill((idx + np.cumsum(is_pm) + 1).astype(str), 2)
+    x_format = _human_readable_nums(x, sig_fig=sig_fig)
+    pm_labels = _str_join(num[is_pm], ': ', x_format[is_pm])
+    bin_labels = _str_join(
+        bin_num[:-1],
+        ': ',
+        np.where((idx[:-1] == 0) & ~is_pm[:-1], '[', '('),
+        x_format[:-1],
+        ', ',
+        x_format[1:],
+        np.where(is_pm[1:], ')', ']'))
+    return bin_labels.tolist(), pm_labels.tolist()
+
+
+def _fit_bins(
+    x, max_levels=20, point_mass_threshold=0.1,
+    sig_fig=3, **kwargs):
+    """
+    Construct the bins `cutter` uses for a numeric variable
+
+    Parameters
+    ----------
+
+    x : pandas.Series, QuantileSketch or ColumnSummary
+        Numeric variable to construct bins from
+
+    max_levels : int
+        Maximum number of bins to create from 'x'
+
+    point_mass_threshold : float
+        Levels of 'x' with frequency greater than point_mass_threshold
+        get their own bin
+
+    sig_fig : int
+        Significant figures to use in binning
+
+    Returns
+    -------
+
+    b : 1-D numpy array
+        Final bin endpoints
+
+    pm : 1-D numpy array
+        Values with point masses
+
+    bin_labels : list
+        Final bin labels
+
+    pm_labels : list
+        Final point mass labels
+    """
+    # pm contains any values that exceed point_mass_threshold
+    # pm is 1-D numpy.array
+    pm = _point_mass(x, threshold = point_mass_threshold)
+
+    # put all remaining non-NaN values in rem
+    if isinstance(x, (QuantileSketch, ColumnSummary)):
+        rem = x._without(pm)
+        n_rem = rem.n
+    else:
+        rem = x.values
+        if len(pm) > 0:
+            rem = rem[~x.isin(pm).values]
+        rem = rem[~np.isnan(rem)]
+        n_rem = len(rem)
+
+    if n_rem > 0:
+        # apply cutpoints to rem if there are non-NaN
+        # values
+        cps = cutpoints(
+            rem,
+            ncuts = max_levels, # - len(pm),
+            **kwargs)
+    else:
+        # Otherwise, rem has no non-NaN values and
+        # we just generate empty cutpoints
+        cps = np.array([])
+
+    # Construct bin_labels and pm_labels
+    b, bin_labels, pm_labels = _finalize_bins(cps, pm, sig_fig=sig_fig)
+    return b, pm, bin_labels, pm_labels
+
+
+def _bin_layout(b, pm, bin_labels, pm_labels):
+    """
+    Map the bins and point masses to their positions among the
+    sorted labels `cutter` uses as categories
+
+    Parameters
+    ----------
+
+    b : 1-D numpy array
+        Final bin endpoints
+
+    pm : 1-D numpy array
+        Values with point masses
+
+    bin_labels : list
+        Final bin labels
+
+    pm_labels : list
+        Final point mass labels
+
+    Returns
+    -------
+
+    categories : list
+        Sorted bin and point mass labels
+
+    edge_codes : 1-D numpy array
+        For each endpoint in 'b', the code of its point mass label
+        or -1 if it is not a point mass
+
+    bin_codes : 1-D numpy array
+        For each bin between consecutive endpoints in 'b', the code
+        of its label
+    """
+    b = np.asarray(b)
+    is_pm = np.isin(b, pm)
+    cum = np.cumsum(is_pm)
+    idx = np.arange(len(b))
+    # Labels are numbered in the order _label_constructor builds them:
+    # each endpoint's point mass label precedes the bin to its right
+    pm_pos = (idx + cum - 1)[is_pm]
+    bin_pos = (idx + cum)[:-1]
+    labels = np.empty(len(pm_pos) + len(bin_pos), dtype=object)
+    labels[pm_pos] = pm_labels
+    labels[bin_pos] = bin_labels
+    order = sorted(range(len(labels)), key=labels.__getitem__)
+    rank = np.empty(len(labels), dtype=np.intp)
+    rank[order] = np.arange(len(labels))
+    edge_codes = np.full(len(b), -1, dtype=np.intp)
+    edge_codes[is_pm] = rank[pm_pos]
+    bin_codes = rank[bin_pos]
+    return labels[order].tolist(), edge_codes, bin_codes
+
+
+def _bin_codes(x, b, edge_codes, bin_codes):
+    """
+    Assign values to fitted bins
+
+    Values equal to a point mass get the point mass code, all other
+    values get the code of the bin (b[i], b[i+1]] containing them, with
+    the lowest bin closed on the left. NaNs and values outside of
+    [b[0], b[-1]] get -1
+
+    Parameters
+    ----------
+
+    x : 1-D numpy array
+        Numeric values to bin
+
+    b : 1-D numpy array
+        Final bin endpoints
+
+    edge_codes : 1-D numpy array
+        Point mass code of each endpoint, from `_bin_layout`
+
+    bin_codes : 1-D numpy array
+        Code of each bin, from `_bin_layout`
+
+    Returns
+    -------
+
+    codes : 1-D numpy array
+        Smallest signed integer type that holds the codes
+    """
+    n_codes = len(bin_codes) + np.count_nonzero(edge_codes >= 0)
+    codes = np.full(len(x), -1, dtype=np.min_scalar_type(-max(n_codes, 1)))
+    if len(b) == 0:
+        return codes
+    j = np.searchsorted(b, x, side='left')
+    jc = np.minimum(j, len(b) - 1)
+    exact = b[jc] == x
+    k = np.where(exact & (j == 0), 0, j - 1)
+    in_bin = (k >= 0) & (k < len(b) - 1)
+    codes[in_bin] = bin_codes[k[in_bin]]
+    is_pm = exact & (edge_codes[jc] >= 0)
+    codes[is_pm] = edge_codes[jc[is_pm]]
+    return codes
+
+
+def _cutter_codes(
+    x, max_levels=20, point_mass_threshold=0.1,
+    sig_fig=3, sketch=None, **kwargs):
+    """
+    Fit bins to a numeric array and assign its values to them
+
+    Parameters
+    ----------
+
+    x : 1-D numpy array
+        Numeric values to bin
+
+    max_levels : int
+        Maximum number of bins to create from 'x'
+
+    point_mass_threshold : float
+        Levels of 'x' with frequency greater than point_mass_threshold
+        get their own bin
+
+    sig_fig : int
+        Significant figures to use in binning
+
+    sketch : QuantileSketch or ColumnSummary
+        Optional summary to construct the bins from instead of 'x'
+
+    Returns
+    -------
+
+    codes : 1-D numpy array
+        Bin codes of the values in 'x', -1 for missing
+
+    labels : list
+        Labels of the bins, in the order of their codes
+    """
+    x = np.asarray(x, dtype=float)
+    params = dict(
+        max_levels=max_levels,
+        point_mass_threshold=point_mass_threshold,
+        sig_fig=sig_fig,
+        **kwargs)
+    if sketch is None:
+        b, pm, bin_labels, pm_labels = cached(
+            '_fit_bins', [x], params,
+            lambda: _fit_bins(pd.Series(x), **params))
+    else:
+        b, pm, bin_labels, pm_labels = _fit_bins(sketch, **params)
+    labels, edge_codes, bin_codes = _bin_layout(
+        b, pm, bin_labels, pm_labels)
+    codes = _bin_codes(x, b, edge_codes, bin_codes)
+    return codes, labels
+
+
+def _cutter_codes_parallel(df, columns, n_jobs, params):
+    """
+    Run `_cutter_codes` on several columns of a pandas.DataFrame in a
+    process pool. The values are copied once into a shared memory block
+    that the workers read from, rather than pickled to every worker
+
+    Parameters
+    ----------
+
+    df : pandas.DataFrame
+
+    columns : list
+        Numeric columns of 'df' to bin
+
+    n_jobs : int
+        Number of worker processes
+
+    params : dict
+        Keyword arguments for `_cutter_codes`
+
+    Returns
+    -------
+
+    list of (codes, labels) tuples, one for each column
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    shape = (len(columns), df.shape[0])
+    shm = shared_memory.SharedMemory(
+        create=True, size=max(int(np.prod(shape)) * 8, 1))
+    try:
+        vals = np.ndarray(shape, dtype=float, buffer=shm.buf)
+        for i, c in enumerate(columns):
+            vals[i] = df[c].values
+        del vals
+        with ProcessPoolExecutor(max_workers=n_jobs) as ex:
+            futures = [
+                ex.submit(_cutter_codes_shm, shm.name, shape, i, params)
+                for i in range(len(columns))]
+            res = [f.result() for f in futures]
+    finally:
+        shm.close()
+        shm.unlink()
+    return res
+
+
+def _cutter_codes_shm(name, shape, i, params):
+    """
+    Worker for `_cutter_codes_parallel`: bin row 'i' of the array
+    of the given 'shape' in the shared memory block 'name'
+    """
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        vals = np.ndarray(shape, dtype=float, buffer=shm.buf)
+        res = _cutter_codes(vals[i], **params)
+        del vals
+    finally:
+        shm.close()
+    return res
+
+
+def _fill_nan_category(z, fill_nan="MISSING"):
+    """
+    Fill the missing values of a categorical pandas.Series, adding
+    'fill_nan' as a category if there are any
+
+    Parameters
+    ----------
+
+    z : pandas.Series
+        Categorical series
+
+    fill_nan : str
+        Value to fill nans with
+
+    Returns
+    -------
+
+    pandas.Series
+    """
+    if not z.isna().any():
+        return z
+    if fill_nan not in z.cat.categories:
+        z = z.cat.add_categories([fill_nan])
+    return z.fillna(fill_nan)
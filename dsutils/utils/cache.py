@@ -0,0 +1,287 @@
+"""
+Opt-in memoization of binning and histogram results
+
+Results are keyed by a fingerprint of the data they are computed from
+plus the parameters of the call, so repeated calls on the same column
+with the same parameters reuse the fitted bins and aggregated tables.
+The cache is off until `enable_cache` is called
+"""
+
+import os
+import pickle
+import hashlib
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+
+_CACHE = None
+_MISSING = object()
+
+
+def enable_cache(max_bytes=256 * 2**20, path=None, max_disk_bytes=None):
+    """
+    Turn on memoization of `cutter`, `_numeric_histogram` and
+    `_categorical_histogram` results
+
+    Parameters
+    ----------
+    max_bytes : int
+        maximum size of the results kept in memory. Least recently
+        used results are evicted first
+
+    path : str
+        optional directory to also store the results in, so that they
+        are reused across processes and sessions
+
+    max_disk_bytes : int
+        maximum size of the results stored in 'path'. If None, the
+        stored results are never evicted
+
+    Returns
+    -------
+    ResultCache
+    """
+    global _CACHE
+    _CACHE = ResultCache(max_bytes, path, max_disk_bytes)
+    return _CACHE
+
+
+def disable_cache():
+    """Turn off memoization and drop the results kept in memory"""
+    global _CACHE
+    _CACHE = None
+
+
+def get_cache():
+    """
+    The active ResultCache, or None if memoization is off
+    """
+    return _CACHE
+
+
+class ResultCache:
+    """
+    Least recently used cache of pickleable results, with an
+    optional second level on disk
+
+    Parameters
+    ----------
+    max_bytes : int
+        maximum pickled size of the results kept in memory
+
+    path : str
+        optional directory to also store the results in
+
+    max_disk_bytes : int
+        maximum size of the results stored in 'path'. If None, the
+        stored results are never evicted
+
+    Attributes
+    ----------
+    hits : int
+        number of lookups answered from memory or disk
+
+    misses : int
+        number of lookups that were not
+
+    evictions : int
+        number of results evicted from memory
+    """
+    def __init__(self, max_bytes=256 * 2**20, path=None, max_disk_bytes=None):
+        self.max_bytes = max_bytes
+        self.path = path
+        self.max_disk_bytes = max_disk_bytes
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+        self._items = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """
+        Look up the result stored under 'key'
+
+        Parameters
+        ----------
+        key : str
+
+        default : value to return if there is no result for 'key'
+        """
+        if key in self._items:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return self._items[key][0]
+        value = self._load(key)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._insert(key, value, len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL)))
+        return value
+
+    def put(self, key, value):
+        """
+        Store 'value' under 'key'
+
+        Parameters
+        ----------
+        key : str
+
+        value : pickleable result
+        """
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        self._insert(key, value, len(data))
+        if self.path is not None:
+            self._store(key, data)
+
+    def clear(self):
+        """Drop the results kept in memory and reset the counters"""
+        self._items.clear()
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        """
+        Counters of the cache
+
+        Returns
+        -------
+        dict
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'items': len(self._items),
+            'nbytes': self.nbytes}
+
+    def _insert(self, key, value, size):
+        if size > self.max_bytes:
+            return
+        if key in self._items:
+            self.nbytes -= self._items.pop(key)[1]
+        self._items[key] = (value, size)
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            _, (_, s) = self._items.popitem(last=False)
+            self.nbytes -= s
+            self.evictions += 1
+
+    def _file(self, key):
+        return os.path.join(self.path, key + '.pkl')
+
+    def _load(self, key):
+        if self.path is None:
+            return _MISSING
+        f = self._file(key)
+        try:
+            with open(f, 'rb') as fh:
+                value = pickle.load(fh)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return _MISSING
+        os.utime(f)
+        return value
+
+    def _store(self, key, data):
+        f = self._file(key)
+        tmp = f'{f}.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as fh:
+            fh.write(data)
+        os.replace(tmp, f)
+        if self.max_disk_bytes is None:
+            return
+        files = []
+        for name in os.listdir(self.path):
+            if name.endswith('.pkl'):
+                st = os.stat(os.path.join(self.path, name))
+                files.append((st.st_mtime, st.st_size, name))
+        total = sum(s for _, s, _ in files)
+        for _, s, name in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.path, name))
+            except OSError:
+                pass
+            total -= s
+
+
+def fingerprint(x):
+    """
+    Hash of the values of a 1-D array-like, which changes if any of
+    the values, their order or their dtype changes
+
+    Parameters
+    ----------
+    x : 1-D array-like
+
+    Returns
+    -------
+    str
+    """
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(getattr(x, 'dtype', None), pd.CategoricalDtype):
+        x = pd.Categorical(x)
+        h.update(b'category')
+        h.update(fingerprint(x.categories).encode())
+        x = x.codes
+    a = np.asarray(x)
+    h.update(str((a.dtype.str, a.shape)).encode())
+    if a.dtype.kind in 'biufcmM':
+        h.update(np.ascontiguousarray(a).view(np.uint8))
+    else:
+        h.update(pd.util.hash_array(a.ravel()).view(np.uint8))
+    return h.hexdigest()
+
+
+def cached(name, columns, params, compute):
+    """
+    Return compute(), memoized in the active cache under a key made
+    of 'name', the fingerprints of 'columns' and 'params'
+
+    Parameters
+    ----------
+    name : str
+        name of the computation
+
+    columns : list of 1-D array-likes the result is computed from
+
+    params : dict
+        other arguments the result depends on. If any is not a str,
+        number, bool, None or a list or tuple of those, the result is
+        not memoized
+
+    compute : function without arguments
+
+    Returns
+    -------
+    the result of compute()
+    """
+    cache = _CACHE
+    if cache is None or not _is_key_param(params):
+        return compute()
+    h = hashlib.blake2b(digest_size=16)
+    h.update(name.encode())
+    for c in columns:
+        h.update(fingerprint(c).encode())
+    h.update(repr(sorted(params.items())).encode())
+    key = h.hexdigest()
+    value = cache.get(key, _MISSING)
+    if value is _MISSING:
+        value = compute()
+        cache.put(key, value)
+    return value
+
+
+def _is_key_param(v):
+    """Whether 'v' has a stable repr to key the cache with"""
+    if v is None or isinstance(v, (str, bool, int, float, np.number)):
+        return True
+    if isinstance(v, (list, tuple)):
+        return all(_is_key_param(i) for i in v)
+    if isinstance(v, dict):
+        return all(isinstance(k, str) and _is_key_param(i) for k, i in v.items())
+    return False
@@ -0,0 +1,136 @@
+"""
+Distinct-count utilities
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def distinct_count(x, limit=None, approx=False, p=12):
+    """
+    Number of distinct values of a 1-D array-like, counting missing
+    values as one value like `len(pd.unique(x))`
+
+    Parameters
+    ----------
+    x : 1-D array-like
+
+    limit : int
+        If not None, stop counting as soon as more than 'limit'
+        distinct values have been seen and return limit + 1. Only the
+        leading values of 'x' are hashed when it has many distinct values
+
+    approx : Boolean
+        If True, return the HyperLogLog estimate of the number of
+        distinct values instead, which takes fixed memory. 'limit'
+        is ignored
+
+    p : int
+        precision of the HyperLogLog estimate
+
+    Returns
+    -------
+    int or float
+    """
+    v = _values(x)
+    if approx:
+        return HyperLogLog(p).update(v).estimate()
+    if limit is None:
+        return len(pd.unique(v))
+    seen = v[:0]
+    start, size = 0, 256
+    while start < len(v):
+        seen = pd.unique(np.concatenate([seen, pd.unique(v[start:start + size])]))
+        if len(seen) > limit:
+            return limit + 1
+        start += size
+        size *= 2
+    return len(seen)
+
+
+class HyperLogLog:
+    """
+    HyperLogLog sketch of the number of distinct values
+
+    Estimates the number of distinct values seen by `update` with a
+    relative standard error of about 1.04 / sqrt(2**p) in 2**p bytes.
+    Sketches with the same 'p' can be merged
+
+    Parameters
+    ----------
+    p : int
+        precision, between 4 and 18
+    """
+    def __init__(self, p=12):
+        if not 4 <= p <= 18:
+            raise ValueError(f"p must be between 4 and 18, but found {p}")
+        self.p = p
+        self.registers = np.zeros(2**p, dtype=np.uint8)
+
+    def update(self, x):
+        """
+        Add values to the sketch
+
+        Parameters
+        ----------
+        x : 1-D array-like
+
+        Returns
+        -------
+        self
+        """
+        h = pd.util.hash_array(_values(x))
+        q = 64 - self.p
+        idx = (h >> np.uint64(q)).astype(np.intp)
+        w = h & np.uint64((1 << q) - 1)
+        rank = (q + 1 - _bit_length(w)).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rank)
+        return self
+
+    def merge(self, other):
+        """
+        Merge another sketch with the same precision into this one
+
+        Parameters
+        ----------
+        other : HyperLogLog
+
+        Returns
+        -------
+        self
+        """
+        if other.p != self.p:
+            raise ValueError("Can only merge sketches of the same precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self):
+        """
+        Estimated number of distinct values
+
+        Returns
+        -------
+        float
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        e = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(int)))
+        zeros = int(np.sum(self.registers == 0))
+        if e <= 2.5 * m and zeros > 0:
+            # linear counting for small cardinalities
+            e = m * np.log(m / zeros)
+        return float(e)
+
+
+def _values(x):
+    """Values of 'x' as a numpy array, with categoricals as their codes"""
+    if isinstance(getattr(x, 'dtype', None), pd.CategoricalDtype):
+        return np.asarray(pd.Categorical(x).codes)
+    return np.asarray(x)
+
+
+def _bit_length(w):
+    """Number of significant bits of each element of a uint64 array"""
+    hi = (w >> np.uint64(32)).astype(np.float64)
+    lo = (w & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(hi > 0, 32 + np.frexp(hi)[1], np.frexp(lo)[1])
@@ -4,7 +4,11 @@ Date utilities
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+
+_DAY = 86400 * 10**9
+
+_CALENDAR_BINS = ['D', 'W', 'M', 'Q']
+
 
 def bin_dates(d, bins=10, midpoints=True):
     """
@@ -12,31 +16,129 @@ def bin_dates(d, bins=10, midpoints=True):
     
     Parameters
     ----------
-    d : 1D array-like of datetimes
+    d : 1D array-like of datetimes. Timezone-aware datetimes are
+        binned on their local wall-clock time, and the bins are
+        timezone-naive
     
-    bins : int or 1D array-like of datetimes
+    bins : int, str or 1D array-like of datetimes
+        int : number of equal-width bins, with endpoints rounded
+            down to whole days, as pandas.cut would construct
+        str : calendar bins, one of 'D' (days), 'W' (weeks from Monday
+            to Sunday), 'M' (months) or 'Q' (quarters)
+        array-like : bin endpoints
     
     midpoints : Boolean
-        if True, use midpoints of bins as labels
-        if False, use bins from pandas.cuts as labels
+        if True, use midpoints of bins, rounded down to whole days,
+            as labels
+        if False, use the bins as labels, closed on the right like
+            pandas.cut, or on the left for calendar bins
         
     Returns
     -------
-    pandas.Series of binned dates
+    pandas.Series of binned dates, as a categorical of datetime64 midpoints
+        or intervals
     """
     if not pd.api.types.is_datetime64_any_dtype(d):
         raise(TypeError("d must be of type datetime64"))
-    if isinstance(bins,int):
-        z, bins = pd.cut(d,bins,retbins=True)
-        bins = [pd.to_datetime(s.date()) for s in bins.tolist()]
-        bins[-1] = bins[-1] + pd.DateOffset(1)
-        
+    index = d.index if isinstance(d, pd.Series) else None
+    name = getattr(d, 'name', None)
+    v = _nanoseconds(d)
+    nat = v == np.iinfo(np.int64).min
+
+    if isinstance(bins, str):
+        codes, edges = _calendar_codes(v, nat, bins)
+        closed = 'left'
+    else:
+        if isinstance(bins, int):
+            edges = _day_edges(v[~nat], bins)
+        else:
+            edges = _nanoseconds(bins)
+        # (edges[i], edges[i+1]] gets code i, like pandas.cut
+        codes = np.searchsorted(edges, v, side='left') - 1
+        codes[nat | (codes < 0) | (codes >= len(edges) - 1)] = -1
+        closed = 'right'
+
     if midpoints:
-        m = [(bins[i-1] + (bins[i] - bins[i-1])/2).date() for i in range(1,len(bins))]
-        d = pd.to_datetime(pd.cut(d,bins,labels=[str(i) for i in m])).dt.date
+        m = edges[:-1] + (edges[1:] - edges[:-1]) // 2
+        m = m - m % _DAY
+        categories = pd.DatetimeIndex(m.view('datetime64[ns]'))
+        if categories.has_duplicates:
+            # bins narrower than two days share a midpoint
+            categories, inv = np.unique(m, return_inverse=True)
+            codes = np.where(codes >= 0, inv[codes], -1)
+            categories = pd.DatetimeIndex(categories.view('datetime64[ns]'))
     else:
-        d = pd.cut(d,bins)
-        
+        categories = pd.IntervalIndex.from_breaks(
+            pd.DatetimeIndex(edges.view('datetime64[ns]')), closed=closed)
+
+    d = pd.Series(
+        pd.Categorical.from_codes(codes, categories=categories, ordered=True),
+        index=index, name=name)
     return(d)
 
 
+def _nanoseconds(d):
+    """
+    int64 nanoseconds since the epoch of a 1D array-like of datetimes
+    of any resolution, in local wall-clock time if timezone-aware
+    """
+    d = pd.DatetimeIndex(d)
+    if d.tz is not None:
+        d = d.tz_localize(None)
+    return np.asarray(d, dtype='datetime64[ns]').view(np.int64)
+
+
+def _day_edges(v, bins):
+    """
+    Endpoints of 'bins' equal-width bins of the int64 nanosecond
+    timestamps 'v', like pandas.cut, rounded down to whole days and
+    with the last endpoint one day later
+    """
+    if len(v) == 0:
+        raise ValueError("Cannot bin an empty or all missing array of dates")
+    mn, mx = v.min() + 0.0, v.max() + 0.0
+    if mn == mx:
+        mn -= 0.001 * abs(mn) if mn != 0 else 0.001
+        mx += 0.001 * abs(mx) if mx != 0 else 0.001
+        edges = np.linspace(mn, mx, bins + 1)
+    else:
+        edges = np.linspace(mn, mx, bins + 1)
+        edges[0] -= (mx - mn) * 0.001
+    edges = edges.astype(np.int64)
+    edges = edges - edges % _DAY
+    edges[-1] += _DAY
+    return np.unique(edges)
+
+
+def _calendar_codes(v, nat, freq):
+    """
+    Codes of the calendar periods of the int64 nanosecond timestamps
+    'v' and the endpoints of the periods, from the first to the last
+    period with a timestamp
+    """
+    if freq not in _CALENDAR_BINS:
+        raise ValueError(
+            f"bins must be an int, array-like or one of {', '.join(_CALENDAR_BINS)}, but found {freq}")
+    t = v.view('datetime64[ns]')
+    if freq == 'D':
+        periods = t.astype('datetime64[D]').view(np.int64)
+    elif freq == 'W':
+        # 1970-01-01 is a Thursday, weeks start on Mondays
+        periods = (t.astype('datetime64[D]').view(np.int64) + 3) // 7
+    else:
+        periods = t.astype('datetime64[M]').view(np.int64)
+        if freq == 'Q':
+            periods = periods // 3
+    if nat.all():
+        raise ValueError("Cannot bin an empty or all missing array of dates")
+    lo, hi = periods[~nat].min(), periods[~nat].max()
+    codes = np.where(nat, -1, periods - lo)
+    p = np.arange(lo, hi + 2)
+    if freq == 'D':
+        edges = p * _DAY
+    elif freq == 'W':
+        edges = (p * 7 - 3) * _DAY
+    else:
+        months = p * 3 if freq == 'Q' else p
+        edges = months.astype('datetime64[M]').astype('datetime64[ns]').view(np.int64)
+    return codes, edges
@@ -0,0 +1,851 @@
+"""
+Histogram tables that are computed without plotting
+"""
+
+import os
+import numpy as np
+import pandas as pd
+from .binners import (
+    human_readable_num,
+    binner_df,
+    QuantileSketch,
+    ColumnSummary,
+    _fit_bins,
+    _bin_layout,
+    _bin_codes,
+    _label_constructor
+)
+from .cardinality import distinct_count
+from .cache import cached
+
+
+_STREAMING_STATS = ['mean', 'sum', 'count', 'min', 'max', 'var', 'std']
+
+
+def numeric_histogram_table(
+    df,
+    x = 'x',
+    oth_columns = None,
+    max_levels = 20,
+    stat = 'mean',
+    min_levels = 20,
+    normalize = False,
+    **kwargs):
+    '''
+    Histogram table of a numeric column, as plotted by
+    `dsutils.utils.histograms.numeric_histogram`
+
+    The table has one row per bin of 'x': 'x' holds the bin labels as
+    an ordered categorical, '_COUNT_' the int64 record counts and
+    each of 'oth_columns' the float64 'stat' within the bin
+
+    Parameters
+    --------------------------
+    df : pandas DataFrame object
+
+    x : the name of the numeric variable in 'df' to construct bins from
+
+    oth_columns : optional list of other columns in 'df' on which to
+        calculate 'stat'
+
+    max_levels : maximum number of bins to create from 'x'
+
+    stat : aggregate statistic to calculate on 'oth_columns' within
+        bins of 'x'
+
+    min_levels : if 'x' has more than min_levels distinct level,
+        induce binning
+
+    normalize : Boolean
+        If True, add the float64 column '_PERCENT_' with the
+        share of records in each bin
+
+    Returns
+    ---------------------------
+    p : pandas DataFrame object
+    '''
+    if 'binner' not in kwargs:
+        kwargs['binner'] = _use_binner(df, x, min_levels, kwargs.get('sketch'))
+    p = _numeric_histogram(
+        df,
+        x = x,
+        oth_columns = oth_columns,
+        max_levels = max_levels,
+        stat = stat,
+        **kwargs)
+    return _typed_table(p, x, normalize)
+
+
+def categorical_histogram_table(
+    df,
+    x = 'x',
+    oth_columns = None,
+    max_levels = 20,
+    oth_val = '_OTHER_',
+    stat = 'mean',
+    normalize = False,
+    **kwargs):
+    '''
+    Histogram table of a categorical column, as plotted by
+    `dsutils.utils.histograms.categorical_histogram`
+
+    The table has one row per level of 'x': 'x' holds the levels as
+    an ordered categorical, '_COUNT_' the int64 record counts and
+    each of 'oth_columns' the float64 'stat' within the level
+
+    Parameters
+    --------------------------
+    df : pandas DataFrame object
+
+    x : the name of the categorical variable in 'df' to construct bins from
+
+    oth_columns : optional list of other columns in 'df' on which to
+        calculate 'stat'
+
+    max_levels : maximum number of bins to create from 'x' - the max_level
+        values of 'x' with the greatest record counts receive their own levels,
+        all other levels are binned as 'oth_val'
+
+    oth_val : str used as value for levels with fewer record counts
+
+    stat : aggregate statistic to calculate on 'oth_columns' within
+        bins of 'x'
+
+    normalize : Boolean
+        If True, add the float64 column '_PERCENT_' with the
+        share of records in each level
+
+    Returns
+    ---------------------------
+    p : pandas DataFrame object
+    '''
+    p = _categorical_histogram(
+        df,
+        x = x,
+        oth_columns = oth_columns,
+        max_levels = max_levels,
+        oth_val = oth_val,
+        stat = stat,
+        **kwargs)
+    return _typed_table(p, x, normalize)
+
+
+def _numeric_histogram(
+    df,
+    x = 'x',
+    oth_columns = None,
+    max_levels = 20,
+    stat = 'mean',
+    binner = True,
+    **kwargs):
+    '''
+    Function for histogramming a numeric column into bins and
+    optionally calculating statistics of other columns within
+    these bins
+    
+    Parameters
+    --------------------------
+    df : pandas DataFrame object
+    
+    x : the name of the numeric variable in 'df' to construct bins from
+    
+    oth_columns : optional list of other columns in 'df' on which to
+        calculate 'stat'
+        
+    max_levels : maximum number of bins to create from 'x'
+    
+    stat : aggregate statistic to calculate on 'oth_columns' within
+        bins of 'x'
+        
+    Returns
+    ---------------------------
+    p : pandas DataFrame object
+    '''
+    if oth_columns is None:
+        oth_columns = []
+    elif isinstance(oth_columns,str):
+        oth_columns = [oth_columns]
+
+    p = cached(
+        '_numeric_histogram',
+        [df[c] for c in [*oth_columns, x]],
+        dict(x=x, oth_columns=oth_columns, max_levels=max_levels,
+             stat=stat, binner=binner, **kwargs),
+        lambda: _compute_numeric_histogram(
+            df, x, oth_columns, max_levels, stat, binner, **kwargs))
+    return(p.copy())
+
+
+def _compute_numeric_histogram(
+    df, x, oth_columns, max_levels, stat, binner, **kwargs):
+    """Uncached body of `_numeric_histogram`"""
+    #x_grp = x + ' _GROUPED_'
+    
+    if len(oth_columns) > 0:
+        stats = dict(zip(oth_columns,[stat]*len(oth_columns)))
+    else:
+        stats = dict()
+        
+    stats['_COUNT_'] = 'sum'
+    
+    if binner:
+        p = (
+            df[[*oth_columns,x]].copy()
+            .assign(**{x: lambda z: binner_df(
+                z, x, max_levels=max_levels, return_column=True, **kwargs)})
+            .assign(_COUNT_ = 1)
+            .groupby(x)
+            .agg(stats)
+            .reset_index()
+            #.rename(columns = {x_grp:x})
+            )
+    else:
+        p = (
+            df[[*oth_columns,x]].copy()
+            .assign(_COUNT_ = 1)
+            .groupby(x,dropna=False)
+            .agg(stats)
+            .reset_index()
+            )
+        vals = p[x].unique().tolist()
+        vals_format = [str(i+1).zfill(2) +
+                       ": " + human_readable_num(j)
+                       for i,j in enumerate(vals)]
+        p.loc[:,x] = p[x].map(dict(zip(vals, vals_format)))
+
+    return(p)
+
+def _categorical_histogram(
+    df,
+    x = 'x',
+    oth_columns = None,
+    max_levels = 20,
+    oth_val = '_OTHER_',
+    stat = 'mean',
+    **kwargs):
+    '''
+    Function for histogramming a categorical variable into bins and
+    optionally calculating statistics of other columns within
+    these bins
+    
+    Parameters
+    --------------------------
+    df : pandas DataFrame object
+    
+    x : the name of the categorical variable in 'df' to construct bins from
+    
+    oth_columns : optional list of other columns in 'df' on which to
+        calculate 'stat'
+        
+    max_levels : maximum number of bins to create from 'x' - the max_level
+        values of 'x' with the greatest record counts receive their own levels,
+        all other levels are binned as 'oth_val'
+        
+    oth_val : str used as value for levels with fewer record counts
+    
+    stat : aggregate statistic to calculate on 'oth_columns' within
+        bins of 'x'
+        
+    Returns
+    ---------------------------
+    p : pandas DataFrame object
+    '''
+
+    if oth_columns is None:
+        oth_columns = []
+    elif isinstance(oth_columns,str):
+        oth_columns = [oth_columns]
+
+    p = cached(
+        '_categorical_histogram',
+        [df[c] for c in [*oth_columns, x]],
+        dict(x=x, oth_columns=oth_columns, max_levels=max_levels,
+             oth_val=oth_val, stat=stat),
+        lambda: _compute_categorical_histogram(
+            df, x, oth_columns, max_levels, oth_val, stat))
+    return(p.copy())
+
+
+def _compute_categorical_histogram(df, x, oth_columns, max_levels, oth_val, stat):
+    """Uncached body of `_categorical_histogram`"""
+    # integer codes of the levels of 'x', in sorted order
+    codes, levels = pd.factorize(df[x], sort=True)
+    valid = codes >= 0
+    codes = codes[valid]
+    cnts = np.bincount(codes, minlength=len(levels))
+
+    # the max_levels levels with the greatest record counts keep their
+    # own group, all others share the last group
+    keep = _top_k_mask(cnts, max_levels)
+    n_keep = int(keep.sum())
+    grp = np.full(len(levels), n_keep, dtype=np.intp)
+    grp[keep] = np.arange(n_keep)
+    grp = grp[codes]
+    grp_labels = np.append(np.asarray(levels, dtype=object)[keep], oth_val)
+
+    grp_cnts = np.bincount(grp, minlength=n_keep + 1)
+    idx = _sorted_groups(grp_labels, np.flatnonzero(grp_cnts > 0))
+
+    p = pd.DataFrame({x: grp_labels[idx]})
+    for c in oth_columns:
+        p[c] = _grouped_stat(df[c].values[valid], grp, n_keep + 1, stat) \
+            .loc[idx].values
+    p['_COUNT_'] = grp_cnts[idx]
+    return(p)
+
+
+
+def _sorted_groups(labels, idx):
+    """
+    Group indices 'idx' ordered by their labels, like groupby. The
+    last label is the value of the other levels, which comes last if
+    it cannot be compared with the levels, e.g. for numeric or date
+    levels
+
+    Parameters
+    ----------
+    labels : 1-D numpy object array of the label of each group
+
+    idx : 1-D numpy array of group indices
+
+    Returns
+    -------
+    1-D numpy array of group indices
+    """
+    try:
+        return idx[np.argsort(labels[idx], kind='mergesort')]
+    except TypeError:
+        pass
+    levels = idx[idx < len(labels) - 1]
+    try:
+        levels = levels[np.argsort(labels[levels], kind='mergesort')]
+    except TypeError:
+        pass
+    return np.append(levels, idx[idx == len(labels) - 1])
+
+
+def _top_k_mask(cnts, k):
+    """
+    Mask of the 'k' largest counts, with ties going to the
+    lower index
+
+    Parameters
+    ----------
+    cnts : 1-D numpy array of counts
+
+    k : int
+
+    Returns
+    -------
+    1-D numpy array of bool
+    """
+    if len(cnts) <= k:
+        return np.ones(len(cnts), dtype=bool)
+    if k <= 0:
+        return np.zeros(len(cnts), dtype=bool)
+    thr = np.partition(cnts, len(cnts) - k)[len(cnts) - k]
+    keep = cnts > thr
+    ties = np.flatnonzero(cnts == thr)
+    keep[ties[:k - keep.sum()]] = True
+    return keep
+
+
+def _grouped_stat(v, grp, n_grp, stat):
+    """
+    Calculate 'stat' of the values 'v' within the groups 'grp',
+    in one bincount pass for the statistics BinnedSummary supports
+    of numeric values
+
+    Parameters
+    ----------
+    v : 1-D numpy array of values
+
+    grp : 1-D numpy array of group codes
+
+    n_grp : int, number of groups
+
+    stat : aggregate statistic, as accepted by
+        pandas.core.groupby.GroupBy.agg
+
+    Returns
+    -------
+    pandas.Series with the statistic of each group, indexed by the
+    group codes
+    """
+    if (isinstance(stat, str) and stat in _STREAMING_STATS and
+            (pd.api.types.is_numeric_dtype(v) or pd.api.types.is_bool_dtype(v))):
+        acc = _init_stats(n_grp)
+        _update_stats(acc, grp, np.asarray(v, dtype=float))
+        z = _finalize_stats(acc, stat)
+        if stat in ('sum', 'min', 'max') and pd.api.types.is_integer_dtype(v):
+            z = z.astype(v.dtype)
+        return pd.Series(z)
+    return pd.Series(v).groupby(grp).agg(stat)
+
+
+def _factorize_levels(v, max_levels=None, oth_val='_OTHER_', fillna=None):
+    """
+    Integer codes of the levels of 'v', keeping only the 'max_levels'
+    levels with the greatest record counts
+
+    Parameters
+    ----------
+    v : pandas.Series
+
+    max_levels : int
+        If not None, all but the max_levels most frequent levels are
+        folded into 'oth_val', which comes last
+
+    oth_val : str used as value for the folded levels
+
+    fillna : value to fill missing values with. If None, missing
+        values get code -1
+
+    Returns
+    -------
+    codes : 1-D numpy array of int
+
+    labels : 1-D numpy object array of the level of each code
+    """
+    if fillna is not None:
+        v = v.fillna(fillna)
+    codes, levels = pd.factorize(v, sort=True)
+    labels = np.asarray(levels, dtype=object)
+    if max_levels is None or len(labels) <= max_levels:
+        return codes, labels
+    keep = _top_k_mask(
+        np.bincount(codes[codes >= 0], minlength=len(labels)), max_levels)
+    n_keep = int(keep.sum())
+    lookup = np.full(len(labels) + 1, -1, dtype=np.intp)
+    lookup[:-1] = n_keep
+    lookup[:-1][keep] = np.arange(n_keep)
+    return lookup[codes], np.append(labels[keep], oth_val)
+
+
+def _crosstab_codes(cx, nx, cy, ny):
+    """
+    Joint counts of two arrays of integer codes in one bincount pass,
+    ignoring negative codes
+
+    Returns
+    -------
+    2-D numpy array of int64 with 'ny' rows and 'nx' columns
+    """
+    ok = (cx >= 0) & (cy >= 0)
+    z = np.bincount(
+        cy[ok].astype(np.int64) * nx + cx[ok], minlength=nx * ny)
+    return z.reshape(ny, nx)
+
+
+def numeric_histogram_from_files(
+    paths,
+    x = 'x',
+    oth_columns = None,
+    max_levels = 20,
+    stat = 'mean',
+    chunksize = 1000000,
+    file_format = None,
+    sketch_k = 2000,
+    **kwargs):
+    '''
+    Function for histogramming a numeric column of parquet or CSV
+    files into bins and optionally calculating statistics of other
+    columns within these bins, without loading the files into memory.
+
+    The files are read twice, one chunk at a time and only the columns
+    needed: the first pass builds a `QuantileSketch` of 'x' to construct
+    the bins from, the second accumulates counts and statistics per bin.
+    The result has the same layout as `_numeric_histogram`, with the
+    same values when the sketch is exact (fewer than about 'sketch_k'
+    values)
+
+    Parameters
+    --------------------------
+    paths : str or list of str
+        parquet (.parquet, .pq) or CSV files
+
+    x : the name of the numeric variable to construct bins from
+
+    oth_columns : optional list of other columns on which to
+        calculate 'stat'
+
+    max_levels : maximum number of bins to create from 'x'
+
+    stat : aggregate statistic to calculate on 'oth_columns' within
+        bins of 'x', one of 'mean', 'sum', 'count', 'min', 'max',
+        'var', 'std'
+
+    chunksize : number of rows to read at a time
+
+    file_format : 'parquet' or 'csv'. If None, inferred from
+        the file extensions
+
+    sketch_k : accuracy parameter 'k' of the QuantileSketch
+
+    Returns
+    ---------------------------
+    p : pandas DataFrame object
+    '''
+    if isinstance(paths, str):
+        paths = [paths]
+    if oth_columns is None:
+        oth_columns = []
+    elif isinstance(oth_columns,str):
+        oth_columns = [oth_columns]
+    if stat not in _STREAMING_STATS:
+        raise ValueError(
+            f"stat must be one of {', '.join(_STREAMING_STATS)}, but found {stat}")
+
+    # First pass: sketch 'x' and construct the bins
+    sketch = QuantileSketch(k=sketch_k)
+    for chunk in _read_chunks(paths, [x], chunksize, file_format):
+        sketch.update(chunk[x].values)
+    summary = BinnedSummary.fit(
+        sketch, x, oth_columns, max_levels=max_levels, **kwargs)
+
+    # Second pass: accumulate counts and statistics within the bins
+    for chunk in _read_chunks(paths, [*oth_columns, x], chunksize, file_format):
+        summary.update(chunk)
+    return summary.to_frame(stat)
+
+
+class BinnedSummary:
+    """
+    Mergeable histogram of a variable over fixed bins
+
+    Holds per-bin record counts and, for each of 'oth_columns', the
+    per-bin counts, sums, sums of squares, minimums and maximums of its
+    non-missing values. Summaries of separate batches of data with the
+    same bins can be merged, so histograms of partitions can be combined
+    without rescanning the data.
+
+    Numeric variables are binned by 'edges' and 'point_masses' like
+    `dsutils.utils.binners.cutter`: missing values and values outside
+    of the edges are counted as 'MISSING'. Categorical variables are
+    binned by 'levels': other levels are counted as 'oth_val' and
+    missing values are dropped, like `_categorical_histogram`
+
+    Parameters
+    ----------
+    x : str
+        the name of the binned variable
+
+    edges : 1-D array-like
+        bin endpoints of a numeric 'x', including any point masses
+
+    point_masses : 1-D array-like
+        values of a numeric 'x' with their own bins
+
+    levels : list
+        levels of a categorical 'x' with their own bins
+
+    oth_columns : optional list of other columns to calculate
+        statistics on within the bins
+
+    oth_val : str used as value for levels not in 'levels'
+
+    sig_fig : int
+        Significant figures to use in the numeric bin labels
+    """
+    def __init__(self, x, edges=None, point_masses=None, levels=None,
+                 oth_columns=None, oth_val='_OTHER_', sig_fig=3):
+        if (edges is None) == (levels is None):
+            raise ValueError("Exactly one of `edges` and `levels` must be provided")
+        self.x = x
+        if oth_columns is None:
+            oth_columns = []
+        elif isinstance(oth_columns,str):
+            oth_columns = [oth_columns]
+        self.oth_columns = list(oth_columns)
+        if edges is not None:
+            self.edges = np.asarray(edges, dtype=float)
+            self.point_masses = np.asarray(
+                [] if point_masses is None else point_masses, dtype=float)
+            self.levels = None
+            bin_labels, pm_labels = _label_constructor(
+                self.edges, self.point_masses, sig_fig=sig_fig)
+            labels, self._edge_codes, self._bin_codes = _bin_layout(
+                self.edges, self.point_masses, bin_labels, pm_labels)
+            self.labels = labels + ['MISSING']
+        else:
+            self.edges = None
+            self.point_masses = None
+            self.levels = list(levels)
+            self.labels = self.levels + [oth_val]
+        k = len(self.labels)
+        self.count = np.zeros(k, dtype=np.int64)
+        self._stats = {c: _init_stats(k) for c in self.oth_columns}
+
+    @classmethod
+    def fit(cls, data, x, oth_columns=None, max_levels=20,
+            point_mass_threshold=0.1, sig_fig=3, **kwargs):
+        """
+        Construct an empty summary with the bins `cutter` would
+        construct for a numeric variable
+
+        Parameters
+        ----------
+        data : pandas.DataFrame, QuantileSketch or ColumnSummary
+            data to construct the bins of 'x' from
+
+        x : str
+            the name of the numeric variable to bin
+
+        oth_columns : optional list of other columns to calculate
+            statistics on within the bins
+
+        max_levels : int
+            maximum number of bins to create from 'x'
+
+        point_mass_threshold : float
+            Levels of 'x' with frequency greater than point_mass_threshold
+            get their own bin
+
+        sig_fig : int
+            Significant figures to use in binning
+
+        Returns
+        -------
+        BinnedSummary
+        """
+        if isinstance(data, pd.DataFrame):
+            data = data[x]
+        b, pm, _, _ = _fit_bins(
+            data,
+            max_levels=max_levels,
+            point_mass_threshold=point_mass_threshold,
+            sig_fig=sig_fig,
+            **kwargs)
+        return cls(x, edges=b, point_masses=pm,
+                   oth_columns=oth_columns, sig_fig=sig_fig)
+
+    def update(self, batch):
+        """
+        Add a batch of records to the summary
+
+        Parameters
+        ----------
+        batch : pandas.DataFrame
+            must include 'x' and 'oth_columns'
+
+        Returns
+        -------
+        self
+        """
+        k = len(self.labels)
+        v = batch[self.x]
+        if self.edges is not None:
+            codes = _bin_codes(
+                np.asarray(v.values, dtype=float),
+                self.edges, self._edge_codes, self._bin_codes)
+            keep = slice(None)
+        else:
+            codes = pd.Categorical(v, categories=self.levels).codes
+            keep = v.notna().values
+        codes = codes.astype(np.intp)
+        codes[codes < 0] = k - 1
+        codes = codes[keep]
+        self.count += np.bincount(codes, minlength=k)
+        for c in self.oth_columns:
+            _update_stats(
+                self._stats[c], codes,
+                np.asarray(batch[c].values, dtype=float)[keep])
+        return self
+
+    def merge(self, other):
+        """
+        Merge another summary with the same bins into this one
+
+        Parameters
+        ----------
+        other : BinnedSummary
+
+        Returns
+        -------
+        self
+        """
+        if (other.x != self.x or
+                other.labels != self.labels or
+                other.oth_columns != self.oth_columns or
+                (self.edges is not None and
+                 not np.array_equal(other.edges, self.edges))):
+            raise ValueError("Can only merge summaries of the same variables and bins")
+        self.count += other.count
+        for c in self.oth_columns:
+            _merge_stats(self._stats[c], other._stats[c])
+        return self
+
+    def to_frame(self, stat='mean'):
+        """
+        Histogram table in the layout of `_numeric_histogram`
+        or `_categorical_histogram`
+
+        Parameters
+        ----------
+        stat : aggregate statistic to calculate on 'oth_columns' within
+            bins, one of 'mean', 'sum', 'count', 'min', 'max',
+            'var', 'std'
+
+        Returns
+        -------
+        p : pandas DataFrame object
+        """
+        if stat not in _STREAMING_STATS:
+            raise ValueError(
+                f"stat must be one of {', '.join(_STREAMING_STATS)}, but found {stat}")
+        if self.edges is not None:
+            # every bin, and MISSING if there are missing values
+            idx = np.arange(len(self.labels) - (self.count[-1] == 0))
+            labels = [self.labels[i] for i in idx]
+            p = pd.DataFrame({self.x: pd.Categorical(labels, categories=labels)})
+        else:
+            # observed levels, sorted like groupby
+            idx = _sorted_groups(
+                np.array(self.labels, dtype=object), np.flatnonzero(self.count > 0))
+            p = pd.DataFrame({self.x: [self.labels[i] for i in idx]})
+        for c in self.oth_columns:
+            p[c] = _finalize_stats(self._stats[c], stat)[idx]
+        p['_COUNT_'] = self.count[idx]
+        return p
+
+
+def _read_chunks(paths, columns, chunksize, file_format=None):
+    """
+    Read 'columns' of parquet or CSV files, 'chunksize' rows at a time
+
+    Parameters
+    ----------
+
+    paths : list of str
+
+    columns : list of str
+
+    chunksize : int
+
+    file_format : str
+        'parquet' or 'csv'. If None, inferred from the file extensions
+
+    Yields
+    ------
+
+    pandas.DataFrame
+    """
+    for path in paths:
+        fmt = file_format
+        if fmt is None:
+            ext = os.path.splitext(path)[1].lower()
+            fmt = 'parquet' if ext in ('.parquet', '.pq') else 'csv'
+        if fmt == 'parquet':
+            import pyarrow.parquet as pq
+            for batch in pq.ParquetFile(path).iter_batches(
+                    batch_size=chunksize, columns=columns):
+                yield batch.to_pandas()
+        elif fmt == 'csv':
+            for chunk in pd.read_csv(path, usecols=columns, chunksize=chunksize):
+                yield chunk
+        else:
+            raise ValueError(f"file_format must be 'parquet' or 'csv', but found {fmt}")
+
+
+def _init_stats(k):
+    """
+    Accumulators for the statistics of one column over 'k' bins. The
+    variance is accumulated as the sum of squared deviations from the
+    mean, 'm2', which unlike a sum of squares keeps its precision for
+    values far from zero
+    """
+    return {
+        'count': np.zeros(k, dtype=np.int64),
+        'sum': np.zeros(k),
+        'mean': np.zeros(k),
+        'm2': np.zeros(k),
+        'min': np.full(k, np.nan),
+        'max': np.full(k, np.nan)}
+
+
+def _update_stats(acc, codes, v):
+    """Add the values 'v' in bins 'codes' to the accumulators 'acc'"""
+    k = len(acc['count'])
+    ok = ~np.isnan(v)
+    codes, v = codes[ok], v[ok]
+    batch = _init_stats(k)
+    batch['count'] = np.bincount(codes, minlength=k)
+    batch['sum'] = np.bincount(codes, weights=v, minlength=k)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        batch['mean'] = np.where(
+            batch['count'] > 0, batch['sum'] / batch['count'], 0)
+    batch['m2'] = np.bincount(
+        codes, weights=(v - batch['mean'][codes])**2, minlength=k)
+    np.fmin.at(batch['min'], codes, v)
+    np.fmax.at(batch['max'], codes, v)
+    _merge_stats(acc, batch)
+
+
+def _merge_stats(acc, other):
+    """
+    Merge the accumulators 'other' into 'acc', combining the means and
+    squared deviations with the parallel formula of Chan et al.
+    """
+    n = acc['count'] + other['count']
+    delta = other['mean'] - acc['mean']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        w = np.where(n > 0, other['count'] / n, 0)
+    acc['m2'] += other['m2'] + delta**2 * acc['count'] * w
+    acc['mean'] += delta * w
+    acc['count'] = n
+    acc['sum'] += other['sum']
+    acc['min'] = np.fmin(acc['min'], other['min'])
+    acc['max'] = np.fmax(acc['max'], other['max'])
+
+
+def _finalize_stats(acc, stat):
+    """Calculate 'stat' for each bin from the accumulators 'acc'"""
+    n = acc['count']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if stat == 'mean':
+            z = acc['sum'] / n
+        elif stat == 'sum':
+            z = acc['sum']
+        elif stat == 'count':
+            z = n
+        elif stat == 'min':
+            z = acc['min']
+        elif stat == 'max':
+            z = acc['max']
+        else:
+            # sample variance, like pandas
+            z = np.where(n > 1, acc['m2'] / (n - 1), np.nan)
+            if stat == 'std':
+                z = np.sqrt(z)
+    return z
+
+
+def _use_binner(df, x, min_levels, sketch=None):
+    """
+    Whether a numeric histogram of 'x' should bin its values, i.e.
+    whether 'x' has more than 'min_levels' distinct levels
+    """
+    if isinstance(sketch, ColumnSummary):
+        return len(sketch.values) + (sketch.n_nan > 0) > min_levels
+    return distinct_count(df[x], limit=min_levels) > min_levels
+
+
+def _typed_table(p, x, normalize=False):
+    """
+    Cast a histogram table to compact types: 'x' to an ordered
+    categorical in the order of the rows, '_COUNT_' to int64 and
+    the statistics to float64
+    """
+    p = p.reset_index(drop=True)
+    labels = p[x].astype(str) if p[x].dtype == object else p[x]
+    levels = pd.unique(np.asarray(labels, dtype=object))
+    p[x] = pd.Categorical(labels, categories=levels, ordered=True)
+    for c in p.columns:
+        if c == '_COUNT_':
+            p[c] = p[c].astype(np.int64)
+        elif c != x:
+            p[c] = p[c].astype(np.float64)
+    if normalize:
+        n = p['_COUNT_'].sum()
+        p['_PERCENT_'] = p['_COUNT_'] / n if n > 0 else np.nan
+    return p
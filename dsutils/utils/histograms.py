@@ -1,14 +1,16 @@
 import numpy as np
-import math
 import pandas as pd
-import matplotlib.pyplot as plt
 import os
-from decimal import Decimal
+import re
+from collections import OrderedDict
 from .dates import bin_dates
-from .binners import (
-    cutpoints,
-    human_readable_num,
-    cutter
+from .histogram_tables import (
+    _numeric_histogram,
+    _categorical_histogram,
+    _use_binner,
+    _typed_table,
+    _factorize_levels,
+    _crosstab_codes
 )
 
 
@@ -41,212 +43,31 @@ def plot_bar(p,
     **kwargs : optional parameters:
         fig : a matplotlib figure
         ax : a matplotlib axis object
+        pool : a BarFigurePool to draw on one of its figures instead
         
     Returns
     ---------------------------
     fig : a matplotlib figure
     '''
+    if kwargs.get('pool') is not None:
+        return kwargs['pool'].figure(
+            p, x, line_columns, normalize,
+            xlabel = kwargs.get('xlabel'), ylabel = kwargs.get('ylabel'))
+    import matplotlib.pyplot as plt
     if 'fig' in kwargs.keys() and 'ax' in kwargs.keys():
         fig = kwargs['fig']; ax = kwargs['ax']
     else:
         fig = plt.figure()
         ax = plt.gca()
-        
-    prop_iter = iter(plt.rcParams['axes.prop_cycle'])
-        
-    n = p.shape[0]
-    if not normalize:
-        _stat = '_COUNT_'
-        _stat_label = 'Count'
-    elif normalize:
-        p['_PERCENT_'] = p._COUNT_ / sum(p._COUNT_)
-        _stat = '_PERCENT_'
-        _stat_label = 'Percent'
-        
-    _ = ax.bar(
-        range(n),
-        p.loc[:,_stat],
-        align='center',
-        width=0.9,
-        color = next(prop_iter)['color']
-    )
-    
-    ax.set_xticks(range(n))
-    ax.set_xticklabels(
-        p.loc[:,x].values.tolist(),
-        rotation=45,ha='right')
-    if line_columns is not None:
-        twinx = ax.twinx()
-        if isinstance(line_columns,str):
-            line_columns = [line_columns]
-        for i, col in enumerate(line_columns):
-            #clr = next(prop_iter)['color']
-            _ = twinx.plot(
-                range(n),
-                p.loc[:,col],
-                marker = 'o',
-                color = next(prop_iter)['color']
-            )
-        twinx.spines['top'].set_visible(False)
-        if 'ylabel' in kwargs:
-            plt.ylabel(kwargs['ylabel'], labelpad = 15)
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
+
+    _draw_bar(ax, p, x, line_columns, normalize,
+              xlabel = kwargs.get('xlabel'), ylabel = kwargs.get('ylabel'))
     plt.sca(ax)
-    plt.ylabel(_stat_label)
-    if 'xlabel' in kwargs:
-        plt.xlabel(kwargs['xlabel'])
     return(fig)
 
 
 
 
-def _numeric_histogram(
-    df,
-    x = 'x',
-    oth_columns = None,
-    max_levels = 20,
-    stat = 'mean',
-    binner = True,
-    **kwargs):
-    '''
-    Function for histogramming a numeric column into bins and
-    optionally calculating statistics of other columns within
-    these bins
-    
-    Parameters
-    --------------------------
-    df : pandas DataFrame object
-    
-    x : the name of the numeric variable in 'df' to construct bins from
-    
-    oth_columns : optional list of other columns in 'df' on which to
-        calculate 'stat'
-        
-    max_levels : maximum number of bins to create from 'x'
-    
-    stat : aggregate statistic to calculate on 'oth_columns' within
-        bins of 'x'
-        
-    Returns
-    ---------------------------
-    p : pandas DataFrame object
-    '''
-    if oth_columns is None:
-        oth_columns = []
-    elif isinstance(oth_columns,str):
-        oth_columns = [oth_columns]
-    
-    #x_grp = x + ' _GROUPED_'
-    
-    if len(oth_columns) > 0:
-        stats = dict(zip(oth_columns,[stat]*len(oth_columns)))
-    else:
-        stats = dict()
-        
-    stats['_COUNT_'] = 'sum'
-    
-    if binner:
-        p = (
-            df[[*oth_columns,x]].copy()
-            .assign(**{x: lambda z: cutter(z,x,max_levels,**kwargs)})
-            .replace({x:{np.nan:'MISSING'}})
-            .assign(_COUNT_ = 1)
-            .groupby(x)
-            .agg(stats)
-            .reset_index()
-            #.rename(columns = {x_grp:x})
-            )
-    else:
-        p = (
-            df[[*oth_columns,x]].copy()
-            .assign(_COUNT_ = 1)
-            .groupby(x,dropna=False)
-            .agg(stats)
-            .reset_index()
-            )
-        vals = p[x].unique().tolist()
-        vals_format = [str(i+1).zfill(2) +
-                       ": " + human_readable_num(j)
-                       for i,j in enumerate(vals)]
-        p.loc[:,x] = p[x].map(dict(zip(vals, vals_format)))
-
-    return(p)
-
-def _categorical_histogram(
-    df,
-    x = 'x',
-    oth_columns = None,
-    max_levels = 20,
-    oth_val = '_OTHER_',
-    stat = 'mean',
-    **kwargs):
-    '''
-    Function for histogramming a categorical variable into bins and
-    optionally calculating statistics of other columns within
-    these bins
-    
-    Parameters
-    --------------------------
-    df : pandas DataFrame object
-    
-    x : the name of the categorical variable in 'df' to construct bins from
-    
-    oth_columns : optional list of other columns in 'df' on which to
-        calculate 'stat'
-        
-    max_levels : maximum number of bins to create from 'x' - the max_level
-        values of 'x' with the greatest record counts receive their own levels,
-        all other levels are binned as 'oth_val'
-        
-    oth_val : str used as value for levels with fewer record counts
-    
-    stat : aggregate statistic to calculate on 'oth_columns' within
-        bins of 'x'
-        
-    Returns
-    ---------------------------
-    p : pandas DataFrame object
-    '''
-
-    if oth_columns is None:
-        oth_columns = []
-    elif isinstance(oth_columns,str):
-        oth_columns = [oth_columns]
-    
-    x_grp = '_' + x + ' _GROUPED_'
-    
-    def _max_lvl_cutoff(f):
-        y = f[x] if f.RN <= max_levels else oth_val
-        return(y)
-    
-    k = {x_grp: lambda z: z.apply(_max_lvl_cutoff, axis = 1)}
-    #k = {x: lambda z: z.apply(_max_lvl_cutoff, axis = 1)}
-    cnts = (
-        df.groupby(x)
-          .size()
-          .to_frame(name='_COUNT_')
-          .reset_index()
-          .sort_values('_COUNT_',ascending = False)
-          .assign(RN = lambda x: x['_COUNT_'].rank(method = 'first',ascending = False))
-          .assign(**k)
-        )
-    m = dict(zip(cnts[x],cnts[x_grp]))
-    if len(oth_columns) > 0:
-        stats = dict(zip(oth_columns,[stat]*len(oth_columns)))
-    else:
-        stats = dict()
-    stats['_COUNT_'] = 'sum'
-    p = (
-        df.assign(**{x_grp: lambda f: f[x].map(m)})
-          .assign(_COUNT_ = 1)
-          .groupby(x_grp)
-          .agg(stats)
-          .reset_index()
-          .rename(columns = {x_grp:x})
-    )
-    return(p)
-
 def numeric_histogram(
     df,
     x = 'x',
@@ -278,6 +99,11 @@ def numeric_histogram(
         
     normalize : Boolean
         If True, transform counts to percents
+
+    **kwargs : optional parameters, including:
+        sketch : QuantileSketch or ColumnSummary of df[x] to construct
+            the bins from. A ColumnSummary is also used to count the
+            distinct levels of 'x'
         
     Returns
     ---------------------------
@@ -285,13 +111,8 @@ def numeric_histogram(
 
     
     '''
-    if 'binner' in kwargs:
-        #binner = kwargs['binner']
-        pass
-    elif len(df[x].unique()) > min_levels:
-        kwargs['binner'] = True
-    else:
-        kwargs['binner'] = False
+    if 'binner' not in kwargs:
+        kwargs['binner'] = _use_binner(df, x, min_levels, kwargs.get('sketch'))
     p = _numeric_histogram(
         df,
         x = x,
@@ -371,10 +192,16 @@ def categorical_heatmap(
     fillna = 'MISSING',
     width_ratios = [3,1],
     height_ratios = [1,3],
-    cmap = 'hot'):
+    cmap = 'hot',
+    max_levels_x = None,
+    max_levels_y = None,
+    oth_val = '_OTHER_'):
     
     """
     Function for creating bivariate categorical heatmap
+
+    The joint and marginal record counts are calculated in one pass
+    over the 'x' and 'y' columns
     
     Parameters
     -------------------------------
@@ -387,7 +214,7 @@ def categorical_heatmap(
         categorical variable in 'df' to plot along the y-axis
     
     stat : str
-        aggregate function to apply to df after grouping by 'x' and 'y'
+        statistic to plot, only 'size' (record counts) is supported
     
     fillna : str
         value to fill numpy NaNs with
@@ -400,14 +227,30 @@ def categorical_heatmap(
     
     cmap : str
         name of matplotlib registered colormap
+
+    max_levels_x : int
+        If not None, only the max_levels_x levels of 'x' with the
+        greatest record counts are plotted, all other levels are
+        binned as 'oth_val'
+
+    max_levels_y : int
+        like 'max_levels_x', for 'y'
+
+    oth_val : str used as value for levels with fewer record counts
     
     Returns
     -------------------------------
     fig : a matplotlib figure
     """
-    
-    df2 = df.fillna({x:fillna,y:fillna}) \
-        .groupby([x,y]).agg(stat).unstack(0)
+    import matplotlib.pyplot as plt
+    if stat != 'size':
+        raise ValueError(f"stat must be 'size', but found {stat}")
+
+    cx, lx = _factorize_levels(df[x], max_levels_x, oth_val, fillna)
+    cy, ly = _factorize_levels(df[y], max_levels_y, oth_val, fillna)
+    cnts = _crosstab_codes(cx, len(lx), cy, len(ly))
+    # combinations without records are left blank
+    df2 = np.where(cnts > 0, cnts, np.nan)
     
     fig, axes = plt.subplots(
     nrows = 2,
@@ -420,21 +263,18 @@ def categorical_heatmap(
         'height_ratios' : height_ratios}
     )
 
-    heatmap = axes[1,0].imshow(df2,aspect='auto',cmap = 'hot');
+    heatmap = axes[1,0].imshow(df2,aspect='auto',cmap = cmap);
 
-    axes[1,0].set_xticks(range(len(df2.columns.tolist())));
-    axes[1,0].set_xticklabels(df2.columns.tolist(),rotation=45, ha='right');
+    axes[1,0].set_xticks(range(len(lx)));
+    axes[1,0].set_xticklabels(lx.tolist(),rotation=45, ha='right');
     axes[1,0].set_xlabel(x);
-    axes[1,0].set_yticks(range(len(df2.index.tolist())));
-    axes[1,0].set_yticklabels(df2.index.tolist());
+    axes[1,0].set_yticks(range(len(ly)));
+    axes[1,0].set_yticklabels(ly.tolist());
     axes[1,0].set_ylabel(y);
 
-    dfx = df.groupby(x).size();
-    axes[0,0].bar(range(len(dfx.index.tolist())),dfx.values);
+    axes[0,0].bar(range(len(lx)),cnts.sum(axis=0));
 
-
-    dfy = df.groupby(y).size();
-    axes[1,1].barh(range(len(dfy.index.tolist())),dfy.values);
+    axes[1,1].barh(range(len(ly)),cnts.sum(axis=1));
 
     axes[0,1].axis('off');
 
@@ -470,6 +310,7 @@ def _stacked_histogram(
     ax : matplotlib axis object
         if None, function will create one
     """
+    import matplotlib.pyplot as plt
     p = df.loc[:,[x,stack_var]] \
         .groupby([x,stack_var], dropna=False).size()
     if stat == 'percent':
@@ -477,7 +318,7 @@ def _stacked_histogram(
     if ax is None:
         fig = plt.figure(figsize=(12,5))
         ax = fig.gca()
-    p = p.stack(1) \
+    p = p.unstack(1) \
         .plot.bar(ax = ax, stacked = True, width = 0.95);
     p.legend(title = stack_var, bbox_to_anchor = (1.05, 1), loc='upper left');
     plt.xticks(rotation = 45, ha = 'right')
@@ -488,8 +329,12 @@ def stacked_dates_histogram(
     title = None, bins = 30, midpoints = True,
     stat = 'count'):
     
+    import matplotlib.pyplot as plt
     df = df.loc[:,[date_var,cat_var]].copy()
-    df.loc[:,date_var] = bin_dates(df.loc[:,date_var], bins, midpoints)
+    df[date_var] = bin_dates(df[date_var], bins, midpoints)
+    if midpoints:
+        df[date_var] = df[date_var].cat.rename_categories(
+            df[date_var].cat.categories.strftime('%Y-%m-%d'))
     
     if ax is None:
         fig = plt.figure(figsize=(12,5))
@@ -497,4 +342,388 @@ def stacked_dates_histogram(
         
     p = _stacked_histogram(df, date_var, cat_var, stat = stat, ax = ax)
     
-    return(p)
\ No newline at end of file
+    return(p)
+
+
+def histogram_report(
+    df,
+    columns = None,
+    out_path = 'histograms.pdf',
+    n_jobs = None,
+    line_columns = None,
+    max_levels = 20,
+    stat = 'mean',
+    min_levels = 20,
+    oth_val = '_OTHER_',
+    normalize = False,
+    figsize = (8,5),
+    dpi = 150,
+    **kwargs):
+    '''
+    Function to write the histograms of many columns to a multi-page
+    PDF or a directory of PNG files
+
+    The histogram tables of all columns are computed first, numeric
+    columns like `numeric_histogram`, date columns in 'max_levels'
+    equal-width bins of `bin_dates` and others like
+    `categorical_histogram`. The figures are then rendered with the
+    Agg backend, optionally in a process pool, without using the
+    global state of pyplot. Each figure is closed as soon as it is
+    written, so memory does not grow with the number of columns
+
+    Parameters
+    --------------------------
+    df : pandas DataFrame object
+
+    columns : optional list of columns in 'df' to histogram. If None,
+        use all columns that are not in 'line_columns'
+
+    out_path : str
+        a path ending in '.pdf' to write a multi-page PDF with one page
+        per column, otherwise a directory to write one PNG file per
+        column to
+
+    n_jobs : int
+        Number of worker processes to render the figures with. If None
+        or 1, render in the current process. If -1, use all CPUs
+
+    line_columns : optional list of other columns in 'df' on which to
+        calculate and plot 'stat' within bins of each column
+
+    max_levels : maximum number of bins to create from each column
+
+    stat : aggregate statistic to calculate on 'line_columns'
+
+    min_levels : if a numeric column has more than min_levels distinct
+        levels, induce binning
+
+    oth_val : str used as value for levels of categorical columns
+        with fewer record counts
+
+    normalize : Boolean
+        If True, use percents instead of counts
+
+    figsize : size of each figure in inches
+
+    dpi : resolution of the rendered figures
+
+    Returns
+    ---------------------------
+    list of str : paths of the written files
+    '''
+    if line_columns is None:
+        line_columns = []
+    elif isinstance(line_columns,str):
+        line_columns = [line_columns]
+    if columns is None:
+        columns = [c for c in df.columns if c not in line_columns]
+    elif isinstance(columns,str):
+        columns = [columns]
+
+    tasks = []
+    for c in columns:
+        if (pd.api.types.is_numeric_dtype(df[c]) and
+                not pd.api.types.is_bool_dtype(df[c])):
+            binner = _use_binner(df, c, min_levels)
+            p = _numeric_histogram(
+                df, x = c, oth_columns = line_columns,
+                max_levels = max_levels, stat = stat,
+                binner = binner, **kwargs)
+        elif pd.api.types.is_datetime64_any_dtype(df[c]):
+            # equal-width date bins, labeled by their midpoints
+            d = bin_dates(df[c], bins = max_levels)
+            d = d.cat.rename_categories(d.cat.categories.strftime('%Y-%m-%d'))
+            p = _categorical_histogram(
+                df[line_columns].assign(**{c: d}), x = c,
+                oth_columns = line_columns, max_levels = max_levels,
+                oth_val = oth_val, stat = stat, **kwargs)
+        else:
+            p = _categorical_histogram(
+                df, x = c, oth_columns = line_columns,
+                max_levels = max_levels, oth_val = oth_val,
+                stat = stat, **kwargs)
+        tasks.append(dict(
+            p = _typed_table(p, c), x = c,
+            line_columns = line_columns or None,
+            normalize = normalize, figsize = figsize, dpi = dpi))
+
+    pdf = out_path.lower().endswith('.pdf')
+    if not pdf:
+        os.makedirs(out_path, exist_ok=True)
+        for i, (task, c) in enumerate(zip(tasks, columns)):
+            task['path'] = os.path.join(
+                out_path, '{:03d}_{}.png'.format(i, re.sub(r'[^\w.-]+', '_', str(c))))
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+    if n_jobs is None or n_jobs <= 1 or len(tasks) <= 1:
+        results = map(_render_histogram_task, tasks)
+        res = _write_report(results, out_path, pdf, dpi)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=n_jobs) as ex:
+            results = ex.map(_render_histogram_task, tasks)
+            res = _write_report(results, out_path, pdf, dpi)
+    return(res)
+
+
+def _render_histogram_task(task):
+    """
+    Worker for `histogram_report`: draw one histogram table on a figure
+    with the Agg backend and write it to the PNG file task['path'] if
+    given. Otherwise return the figure, which is pickled when returned
+    from a worker process, so that it is written to the PDF report as
+    vector graphics
+
+    Returns
+    -------
+    str or matplotlib figure : the path written to or the figure
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=task['figsize'], dpi=task['dpi'])
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    _draw_bar(ax, task['p'], task['x'], task['line_columns'],
+              task['normalize'], xlabel = task['x'])
+    fig.tight_layout()
+    if 'path' not in task:
+        return fig
+    try:
+        fig.savefig(task['path'], format='png', dpi=task['dpi'])
+        return task['path']
+    finally:
+        fig.clear()
+
+
+def _write_report(results, out_path, pdf, dpi):
+    """
+    Collect the results of `_render_histogram_task` in order, saving
+    each figure to a page of the PDF 'out_path' if 'pdf'
+    """
+    if not pdf:
+        return list(results)
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    with PdfPages(out_path) as pages:
+        for fig in results:
+            try:
+                pages.savefig(fig, dpi=dpi)
+            finally:
+                fig.clear()
+    return [out_path]
+
+
+def _draw_bar(ax, p, x, line_columns=None, normalize=False,
+              xlabel=None, ylabel=None):
+    """
+    Draw the bar plot of `plot_bar` on the axis 'ax' using only the
+    object-oriented interface of matplotlib
+
+    Parameters
+    ----------
+    ax : matplotlib axis object
+
+    p : pandas.DataFrame
+        histogram table with columns 'x', '_COUNT_' and 'line_columns'
+
+    x : str
+
+    line_columns : optional list of columns to plot as lines
+
+    normalize : Boolean
+        If True, plot percents instead of counts
+
+    xlabel : optional label of the x-axis
+
+    ylabel : optional label of the axis of the lines
+    """
+    import matplotlib as mpl
+    prop_iter = iter(mpl.rcParams['axes.prop_cycle'])
+
+    n = p.shape[0]
+    heights = p['_COUNT_'].values
+    if normalize:
+        heights = heights / heights.sum()
+        _stat_label = 'Percent'
+    else:
+        _stat_label = 'Count'
+
+    ax.bar(
+        range(n),
+        heights,
+        align='center',
+        width=0.9,
+        color = next(prop_iter)['color']
+    )
+
+    ax.set_xticks(range(n))
+    ax.set_xticklabels(
+        p.loc[:,x].values.tolist(),
+        rotation=45,ha='right')
+    if line_columns is not None:
+        twinx = ax.twinx()
+        if isinstance(line_columns,str):
+            line_columns = [line_columns]
+        for col in line_columns:
+            twinx.plot(
+                range(n),
+                p.loc[:,col],
+                marker = 'o',
+                color = next(prop_iter)['color']
+            )
+        twinx.spines['top'].set_visible(False)
+        if ylabel is not None:
+            twinx.set_ylabel(ylabel, labelpad = 15)
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.set_ylabel(_stat_label)
+    if xlabel is not None:
+        ax.set_xlabel(xlabel)
+
+
+class BarFigurePool:
+    """
+    Pool of pre-styled figures for rendering many bar plots like
+    `plot_bar` without pyplot
+
+    A figure is created, with the dsutils style, for each combination
+    of the number of bars and the number of lines that is rendered.
+    Later plots of the same shape update the bar heights, tick labels
+    and line data of that figure in place instead of drawing new
+    artists. The figures have fixed margins rather than a layout fitted
+    to each plot's labels, and the least recently used figure is
+    dropped when there are more than 'size' shapes
+
+    Parameters
+    ----------
+    size : int
+        maximum number of figures to keep
+
+    figsize : size of the figures in inches
+
+    dpi : resolution of the rendered figures
+
+    style : dict of matplotlib rcParams. If None, use
+        `dsutils.style.styles.DSUTILS_STYLE`
+    """
+    def __init__(self, size=8, figsize=(8,5), dpi=100, style=None):
+        if style is None:
+            from ..style.styles import DSUTILS_STYLE
+            style = DSUTILS_STYLE
+        self.size = size
+        self.figsize = figsize
+        self.dpi = dpi
+        self.style = style
+        self._figs = OrderedDict()
+
+    def figure(self, p, x, line_columns=None, normalize=False,
+               xlabel=None, ylabel=None):
+        """
+        Draw a histogram table on a figure of the pool. The figure is
+        reused by later calls, so it must be saved before the next one
+
+        Parameters
+        ----------
+        p : pandas.DataFrame
+            histogram table with columns 'x', '_COUNT_' and 'line_columns'
+
+        x : str
+
+        line_columns : optional list of columns to plot as lines
+
+        normalize : Boolean
+            If True, plot percents instead of counts
+
+        xlabel : optional label of the x-axis
+
+        ylabel : optional label of the axis of the lines
+
+        Returns
+        -------
+        fig : a matplotlib figure
+        """
+        import matplotlib as mpl
+        if isinstance(line_columns,str):
+            line_columns = [line_columns]
+        key = (p.shape[0], len(line_columns or []))
+        with mpl.style.context(self.style):
+            if key not in self._figs:
+                self._figs[key] = self._new_figure(
+                    p, x, line_columns, normalize, xlabel, ylabel)
+                if len(self._figs) > self.size:
+                    _, old = self._figs.popitem(last=False)
+                    old.clear()
+                return self._figs[key]
+            self._figs.move_to_end(key)
+            fig = self._figs[key]
+            _update_bar(fig, p, x, line_columns, normalize, xlabel, ylabel)
+        return fig
+
+    def render(self, p, x, line_columns=None, normalize=False,
+               xlabel=None, ylabel=None, format='png'):
+        """
+        Render a histogram table to an image
+
+        Parameters
+        ----------
+        p, x, line_columns, normalize, xlabel, ylabel : see `figure`
+
+        format : image format accepted by matplotlib's savefig
+
+        Returns
+        -------
+        bytes
+        """
+        import io
+        import matplotlib as mpl
+        fig = self.figure(p, x, line_columns, normalize, xlabel, ylabel)
+        buf = io.BytesIO()
+        with mpl.style.context(self.style):
+            fig.savefig(buf, format=format, dpi=self.dpi)
+        return buf.getvalue()
+
+    def close(self):
+        """Drop all figures of the pool"""
+        for fig in self._figs.values():
+            fig.clear()
+        self._figs.clear()
+
+    def _new_figure(self, p, x, line_columns, normalize, xlabel, ylabel):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        fig = Figure(figsize=self.figsize, dpi=self.dpi)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        _draw_bar(ax, p, x, line_columns, normalize, xlabel, ylabel)
+        if xlabel is None:
+            # keep a label to update in place
+            ax.set_xlabel('')
+        fig.subplots_adjust(bottom=0.3, top=0.95, left=0.1, right=0.9)
+        return fig
+
+
+def _update_bar(fig, p, x, line_columns, normalize, xlabel, ylabel):
+    """
+    Update the artists of a figure drawn by `_draw_bar` with a histogram
+    table with the same number of rows and line columns
+    """
+    ax = fig.axes[0]
+    heights = p['_COUNT_'].values
+    if normalize:
+        heights = heights / heights.sum()
+    for rect, h in zip(ax.patches, heights):
+        rect.set_height(h)
+    ax.set_xticklabels(p.loc[:,x].values.tolist(), rotation=45, ha='right')
+    ax.set_ylabel('Percent' if normalize else 'Count')
+    ax.set_xlabel('' if xlabel is None else xlabel)
+    ax.relim()
+    ax.autoscale_view()
+    if line_columns:
+        twinx = fig.axes[1]
+        for line, col in zip(twinx.lines, line_columns):
+            line.set_ydata(p.loc[:,col].values)
+        twinx.set_ylabel('' if ylabel is None else ylabel, labelpad = 15)
+        twinx.relim()
+        twinx.autoscale_view()
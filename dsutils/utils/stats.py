@@ -1,9 +1,10 @@
-import scipy.stats as ss
+import os
 import numpy as np
 from itertools import combinations_with_replacement
 import pandas as pd
-from scipy.sparse.csgraph import reverse_cuthill_mckee
-from scipy.sparse import csr_matrix
+
+# contingency tables with more cells are built as sparse matrices
+_MAX_DENSE_CELLS = 2**22
 
 def cramers_corrected_stat(confusion_matrix):
     """
@@ -17,25 +18,33 @@ def cramers_corrected_stat(confusion_matrix):
     
     Parameters
     --------------------------
-    confusion_matrix : numpy confusion matrix
+    confusion_matrix : numpy confusion matrix, or scipy sparse matrix
+        for tables with many levels. Empty rows and columns are ignored
         
     Returns
     ---------------------------
     float : Cramer's V statistic with bias correction
     """
-    chi2 = ss.chi2_contingency(confusion_matrix)[0]
-    n = confusion_matrix.sum()
-    phi2 = chi2/n
-    r,k = confusion_matrix.shape
-    phi2corr = max(0, phi2 - ((k-1)*(r-1))/(n-1))    
-    rcorr = r - ((r-1)**2)/(n-1)
-    kcorr = k - ((k-1)**2)/(n-1)
-    return(np.sqrt(phi2corr / min( (kcorr-1), (rcorr-1))))
+    return(_cramers_corrected(*_table_stats(confusion_matrix)))
 
-def cramers_corrected_matrix(df, reorder_cuthill_mckee = True):
+def cramers_corrected_matrix(
+    df, reorder_cuthill_mckee = True, n_jobs = None, approx = False,
+    error = 0.02, confidence = 0.95, n_boot = 100, threshold = None,
+    strata = None, random_state = None):
     """
     Calculate Cramers V statistic with bias correction for all
     combinations of columns in pandas DataFrame df
+
+    Every column is factorized once into integer codes, and the
+    contingency table of each pair of columns is counted from the
+    codes with one bincount. Records with a missing value in either
+    column of a pair are ignored, like pandas.crosstab
+
+    With approx=True, the statistics are calculated on a row sample
+    large enough for a margin of error of about 'error', with bootstrap
+    confidence intervals. The bootstrap resamples each pair's sample
+    contingency table, which is equivalent to resampling the rows,
+    with all replicates of a pair in one batch
     
     Parameters
     --------------------------
@@ -44,45 +53,705 @@ def cramers_corrected_matrix(df, reorder_cuthill_mckee = True):
     reorder_cuthill_mckee : boolean - whether to reorder to the columns
         based on the reverse Cuthill McKee algorithm applied to the
         matrix of Cramers V statistics
+
+    n_jobs : int - number of worker processes to spread the column
+        pairs over. If None or 1, use the current process. If -1, use
+        all CPUs. Workers read the codes from shared memory, which
+        requires Python 3.8 or later
+
+    approx : boolean - whether to approximate the statistics on a
+        row sample
+
+    error : float - target margin of error of the approximate
+        statistics at the 'confidence' level, which determines the
+        sample size
+
+    confidence : float - confidence level of the intervals
+
+    n_boot : int - number of bootstrap replicates
+
+    threshold : float - optional value of Cramers V. Pairs whose
+        confidence interval contains 'threshold' are flagged, so they
+        can be recalculated exactly
+
+    strata : str - optional column of df to stratify the sample by,
+        so that each of its levels is sampled in proportion
+
+    random_state : int - seed of the sample and the bootstrap
         
     Returns
     ---------------------------
     Z : numpy array with Cramers V statistics
+
+    If approx=True, the tuple (Z, lower, upper, flagged) of the
+    approximate statistics, the lower and upper confidence bounds in
+    the same layout, and the list of flagged pairs of columns
     """
     cols = df.columns.tolist()
-    Z = np.zeros((len(cols),len(cols)))
-    
-    for i,j in combinations_with_replacement(range(len(cols)),2):
-        z = cramers_corrected_stat(
-                pd.crosstab(df[cols[i]],df[cols[j]]).values
-            )
-        Z[i,j] = Z[j,i] = z
+    if approx:
+        rng = np.random.default_rng(random_state)
+        df = _stratified_sample(df, _sample_size(error, confidence), strata, rng)
+    codes, n_levels = _factorize_columns(df)
+    pairs = list(combinations_with_replacement(range(len(cols)),2))
+
+    vals = _cramers_corrected(*_chi2_pairs_n_jobs(codes, n_levels, pairs, n_jobs).T)
+    Z = _pairs_to_matrix(vals, pairs, len(cols))
+    if approx:
+        lo, hi = _bootstrap_pairs(codes, n_levels, pairs, n_boot, confidence, rng)
+        lower = _pairs_to_matrix(lo, pairs, len(cols))
+        upper = _pairs_to_matrix(hi, pairs, len(cols))
         
     if reorder_cuthill_mckee is True:
+        from scipy.sparse.csgraph import reverse_cuthill_mckee
+        from scipy.sparse import csr_matrix
         perm = reverse_cuthill_mckee(
             csr_matrix(Z),
             symmetric_mode = True
         )
         cols = [cols[i] for i in perm]
-        gx,gy = np.meshgrid(perm,perm)
-        Z = (csr_matrix(Z)[gx,gy]).toarray()
+        Z = Z[np.ix_(perm,perm)]
+        if approx:
+            lower = lower[np.ix_(perm,perm)]
+            upper = upper[np.ix_(perm,perm)]
         
     Z = pd.DataFrame(
             Z,
             index = cols,
             columns = cols
         )
-    
-    return(Z)
+    if not approx:
+        return(Z)
+
+    lower = pd.DataFrame(lower, index = cols, columns = cols)
+    upper = pd.DataFrame(upper, index = cols, columns = cols)
+    flagged = []
+    if threshold is not None:
+        i, j = np.nonzero(
+            np.triu((lower.values <= threshold) & (upper.values >= threshold), 1))
+        flagged = [(cols[a], cols[b]) for a, b in zip(i, j)]
+    return(Z, lower, upper, flagged)
 
 def cramers_v(df,x,y):
-    if isinstance(x,str): x = np.array([x])
-    elif isinstance(x,list): x = np.array(x)
-        
-    @np.vectorize
-    def _cramers_v(x):
-        z = cramers_corrected_stat(
-                pd.crosstab(df[x],df[y]).values)
-        return(z)
-    
-    return(_cramers_v(x))
\ No newline at end of file
+    """
+    Calculate Cramers V statistic with bias correction of each of the
+    columns 'x' of df with the column 'y'
+
+    Parameters
+    --------------------------
+    df : pandas DataFrame
+
+    x : str or list of str
+
+    y : str
+
+    Returns
+    ---------------------------
+    numpy array with the Cramers V statistic of each of 'x'
+    """
+    if isinstance(x,str): x = [x]
+    return(cramers_v_many(df, x, y, sort=False).values)
+
+def cramers_v_many(df, xs=None, y=None, n_jobs=None, sort=True):
+    """
+    Calculate Cramers V statistic with bias correction of many
+    columns of df with one target column 'y'
+
+    'y' is factorized once, the contingency table of each candidate
+    is counted from the integer codes with one bincount and the
+    bias correction is applied to all candidates at once
+
+    Parameters
+    --------------------------
+    df : pandas DataFrame
+
+    xs : list of str - candidate columns. If None, use all columns
+        other than 'y'
+
+    y : str - target column
+
+    n_jobs : int - number of worker processes to spread the candidates
+        over. If None or 1, use the current process. If -1, use all
+        CPUs. Workers read the codes from shared memory, which requires
+        Python 3.8 or later
+
+    sort : boolean - whether to sort the result in descending order
+
+    Returns
+    ---------------------------
+    pandas Series of Cramers V statistics indexed by the candidates
+    """
+    if y is None:
+        raise ValueError("y must be provided")
+    if xs is None:
+        xs = [c for c in df.columns if c != y]
+    elif isinstance(xs,str):
+        xs = [xs]
+    codes, n_levels = _factorize_columns(df[[*xs, y]])
+    pairs = [(i, len(xs)) for i in range(len(xs))]
+    vals = _cramers_corrected(*_chi2_pairs_n_jobs(codes, n_levels, pairs, n_jobs).T)
+    z = pd.Series(vals, index=xs, name=y)
+    if sort:
+        z = z.sort_values(ascending=False, kind='mergesort')
+    return(z)
+
+def association_matrix(df, numeric = None, reorder_cuthill_mckee = True, n_jobs = None):
+    """
+    Calculate the association of all combinations of columns of
+    pandas DataFrame df, whatever their types
+
+    - categorical with categorical : Cramers V with bias correction,
+      as in cramers_corrected_matrix
+    - numeric with categorical : correlation ratio (eta), from the
+      sums of the numeric column grouped by the codes of the
+      categorical one, counted with np.bincount
+    - numeric with numeric : Pearson correlation, from one matrix
+      product of the standardized numeric columns
+
+    Records with a missing value in either column of a pair are
+    ignored, like pandas.DataFrame.corr
+
+    Parameters
+    --------------------------
+    df : pandas DataFrame
+
+    numeric : list of str - numeric columns. If None, use the columns
+        with a numeric dtype other than boolean. All other columns are
+        treated as categorical
+
+    reorder_cuthill_mckee : boolean - whether to reorder columns with
+        the reverse Cuthill-McKee algorithm on the absolute values of
+        the associations
+
+    n_jobs : int - number of worker processes to spread the
+        categorical pairs over, as in cramers_corrected_matrix
+
+    Returns
+    ---------------------------
+    pandas DataFrame of associations. Pearson correlations keep their
+    sign, Cramers V and correlation ratios are between 0 and 1
+    """
+    cols = df.columns.tolist()
+    if numeric is None:
+        numeric = [c for c in cols
+            if pd.api.types.is_numeric_dtype(df[c])
+            and not pd.api.types.is_bool_dtype(df[c])]
+    num = [i for i, c in enumerate(cols) if c in set(numeric)]
+    cat = [i for i, c in enumerate(cols) if c not in set(numeric)]
+
+    Z = np.zeros((len(cols),len(cols)))
+    if len(cat) > 0:
+        codes, n_levels = _factorize_columns(df.iloc[:, cat])
+        pairs = list(combinations_with_replacement(range(len(cat)),2))
+        vals = _cramers_corrected(*_chi2_pairs_n_jobs(codes, n_levels, pairs, n_jobs).T)
+        Z[np.ix_(cat,cat)] = _pairs_to_matrix(vals, pairs, len(cat))
+    if len(num) > 0:
+        X = np.column_stack([
+            pd.to_numeric(df.iloc[:, i], errors='coerce').to_numpy(dtype=float)
+            for i in num])
+        Z[np.ix_(num,num)] = _pearson(X)
+    if len(cat) > 0 and len(num) > 0:
+        eta = _correlation_ratio(codes, n_levels, X)
+        Z[np.ix_(cat,num)] = eta
+        Z[np.ix_(num,cat)] = eta.T
+
+    if reorder_cuthill_mckee is True:
+        from scipy.sparse.csgraph import reverse_cuthill_mckee
+        from scipy.sparse import csr_matrix
+        perm = reverse_cuthill_mckee(
+            csr_matrix(np.nan_to_num(np.abs(Z))),
+            symmetric_mode = True
+        )
+        cols = [cols[i] for i in perm]
+        Z = Z[np.ix_(perm,perm)]
+
+    Z = pd.DataFrame(
+            Z,
+            index = cols,
+            columns = cols
+        )
+
+    return(Z)
+
+def top_associations(df, k = 10, threshold = None, sketch_size = 8192,
+    confidence = 0.999, n_jobs = None, random_state = None):
+    """
+    Find the most associated pairs of columns of pandas DataFrame df
+    by Cramers V with bias correction, without calculating all pairs
+
+    Each column is sketched by whether 'sketch_size' random pairs of
+    records agree on it, weighted by the inverse frequency of the
+    level. The products of the sketches estimate the chi-square
+    statistic of every pair with one matrix product, and pairs whose
+    upper confidence bound cannot qualify are skipped. The statistic
+    is calculated exactly for the remaining candidates. Missing values
+    are treated as a level when screening, and ignored when calculating
+    the statistic exactly
+
+    Pairs of columns with many levels are sketched with little
+    precision, so they are rarely skipped. Neither are the partners of
+    columns without any strong association when only 'k' is given, as
+    any of them may be in the top 'k', so a 'threshold' skips far more
+
+    Parameters
+    --------------------------
+    df : pandas DataFrame
+
+    k : int - number of strongest partners to keep for each column.
+        If None, keep all pairs above 'threshold'
+
+    threshold : float - optional minimum Cramers V of the pairs to keep
+
+    sketch_size : int - number of random pairs of records in the sketch
+
+    confidence : float - confidence level of the bounds used to skip
+        pairs. Higher levels skip fewer pairs and miss fewer of them
+
+    n_jobs : int - number of worker processes to spread the candidate
+        pairs over, as in cramers_corrected_matrix
+
+    random_state : int - seed of the sketch
+
+    Returns
+    ---------------------------
+    pandas DataFrame with columns 'x', 'y' and 'cramers_v' and one row
+    per pair in the top 'k' of either column, in descending order
+    """
+    if k is None and threshold is None:
+        raise ValueError("one of k or threshold must be provided")
+    cols = df.columns.tolist()
+    codes, n_levels = _factorize_columns(df)
+    rng = np.random.default_rng(random_state)
+    pairs = _screen_pairs(codes, n_levels, k, threshold, sketch_size, confidence, rng)
+
+    vals = _cramers_corrected(*_chi2_pairs_n_jobs(codes, n_levels, pairs, n_jobs).T)
+    keep = ~np.isnan(vals)
+    if threshold is not None:
+        keep &= vals >= threshold
+    pairs, vals = pairs[keep], vals[keep]
+    if k is not None:
+        # rank the partners of each column, with each pair listed twice
+        a = np.concatenate([pairs[:, 0], pairs[:, 1]])
+        v = np.concatenate([vals, vals])
+        order = np.lexsort((-v, a))
+        first = np.searchsorted(a[order], a[order])
+        rank = np.arange(len(order)) - first
+        top = np.unique(order[rank < k] % max(len(pairs), 1))
+        pairs, vals = pairs[top], vals[top]
+
+    order = np.argsort(-vals, kind='mergesort')
+    return(pd.DataFrame({
+        'x': [cols[i] for i in pairs[order, 0]],
+        'y': [cols[j] for j in pairs[order, 1]],
+        'cramers_v': vals[order]}))
+
+def _factorize_columns(df):
+    """
+    Integer codes of the levels of every column of 'df'
+
+    Returns
+    -------
+    codes : 2-D numpy array of int32 with one row per column, -1 for
+        missing values
+
+    n_levels : 1-D numpy array with the number of levels of each column
+    """
+    codes = np.empty((df.shape[1], df.shape[0]), dtype=np.int32)
+    n_levels = np.empty(df.shape[1], dtype=np.int64)
+    for i, c in enumerate(df.columns):
+        z, levels = pd.factorize(df.iloc[:, i])
+        codes[i] = z
+        n_levels[i] = len(levels)
+    return codes, n_levels
+
+
+def _contingency(ci, ni, cj, nj, max_dense_cells=None):
+    """
+    Contingency table of two arrays of integer codes with 'ni' and 'nj'
+    levels, ignoring records where either code is missing
+
+    The table is a dense numpy array counted with one bincount, or a
+    scipy.sparse.coo_matrix of the observed combinations if it would
+    have more than 'max_dense_cells' cells, by default _MAX_DENSE_CELLS
+    """
+    if max_dense_cells is None:
+        max_dense_cells = _MAX_DENSE_CELLS
+    ok = (ci >= 0) & (cj >= 0)
+    z = ci[ok].astype(np.int64) * nj + cj[ok]
+    if ni * nj <= max_dense_cells:
+        return np.bincount(z, minlength=ni * nj).reshape(ni, nj)
+    from scipy.sparse import coo_matrix
+    cells, cnts = np.unique(z, return_counts=True)
+    return coo_matrix((cnts, (cells // nj, cells % nj)), shape=(ni, nj))
+
+
+def _table_stats(t):
+    """
+    Pearson's chi-square statistic of a dense or sparse contingency
+    table, with Yates' correction for 2x2 tables like
+    scipy.stats.chi2_contingency, the number of records and the numbers
+    of rows and columns that are not empty
+
+    For a sparse table, the statistic is summed over the nonzero cells
+    and each empty cell adds its expected count, which together is the
+    number of records less the expected counts of the nonzero cells
+
+    Returns
+    -------
+    tuple of chi2, n, r, k
+    """
+    if hasattr(t, 'tocoo'):
+        t = t.tocoo(copy=True)
+        t.sum_duplicates()
+        a = np.asarray(t.sum(axis=1), dtype=float).ravel()
+        b = np.asarray(t.sum(axis=0), dtype=float).ravel()
+        r, k = int((a > 0).sum()), int((b > 0).sum())
+        if r * k > 4:
+            nz = t.data != 0
+            o = t.data[nz].astype(float)
+            n = o.sum()
+            e = a[t.row[nz]] * b[t.col[nz]] / n
+            chi2 = np.sum((o - e)**2 / e) + (n - e.sum())
+            return max(float(chi2), 0.0), n, r, k
+        t = t.tocsr()[a > 0][:, b > 0].toarray()
+    t = np.asarray(t, dtype=float)
+    t = t[t.any(axis=1)][:, t.any(axis=0)]
+    if t.size == 0:
+        return np.nan, 0.0, 0, 0
+    n = t.sum()
+    e = np.outer(t.sum(axis=1), t.sum(axis=0)) / n
+    d = t - e
+    if t.shape == (2, 2):
+        d = np.sign(d) * np.maximum(np.abs(d) - 0.5, 0)
+    return float(np.sum(d * d / e)), n, t.shape[0], t.shape[1]
+
+
+def _cramers_corrected(chi2, n, r, k):
+    """
+    Cramers V with the bias correction of Bergsma and Wicher from
+    the chi-square statistic of an r x k table of n records
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.sqrt(np.maximum(0, _phi2_corrected(chi2, n, r, k)))
+
+
+def _phi2_corrected(chi2, n, r, k):
+    """
+    Square of Cramers V with the bias correction of Bergsma and Wicher,
+    before negative values are set to zero
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        phi2corr = chi2 / n - ((k-1)*(r-1))/(n-1)
+        rcorr = r - ((r-1)**2)/(n-1)
+        kcorr = k - ((k-1)**2)/(n-1)
+        return phi2corr / np.minimum(kcorr-1, rcorr-1)
+
+
+def _chi2_pairs(codes, n_levels, pairs):
+    """
+    Chi-square statistic, number of records and shape of the
+    contingency table of each pair of rows of 'codes'
+
+    Returns
+    -------
+    2-D numpy array with columns chi2, n, r, k and one row per pair
+    """
+    vals = np.empty((len(pairs), 4))
+    for m, (i,j) in enumerate(pairs):
+        vals[m] = _table_stats(
+            _contingency(codes[i], n_levels[i], codes[j], n_levels[j]))
+    return vals
+
+
+def _chi2_pairs_n_jobs(codes, n_levels, pairs, n_jobs=None):
+    """
+    Run `_chi2_pairs` in the current process or, if n_jobs > 1 or
+    n_jobs == -1, in a process pool
+    """
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+    if n_jobs is None or n_jobs <= 1 or len(pairs) <= 1:
+        return _chi2_pairs(codes, n_levels, pairs)
+    return _chi2_pairs_parallel(codes, n_levels, pairs, n_jobs)
+
+
+def _chi2_pairs_parallel(codes, n_levels, pairs, n_jobs):
+    """
+    Run `_chi2_pairs` in a process pool. The codes are copied once
+    into a shared memory block that the workers read from
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(create=True, size=max(codes.nbytes, 1))
+    try:
+        buf = np.ndarray(codes.shape, dtype=codes.dtype, buffer=shm.buf)
+        buf[:] = codes
+        del buf
+        chunks = np.array_split(np.arange(len(pairs)), min(len(pairs), n_jobs * 4))
+        with ProcessPoolExecutor(max_workers=n_jobs) as ex:
+            futures = [
+                ex.submit(
+                    _chi2_pairs_shm, shm.name, codes.shape, codes.dtype.str,
+                    n_levels, [pairs[m] for m in chunk])
+                for chunk in chunks]
+            vals = np.concatenate([f.result() for f in futures])
+    finally:
+        shm.close()
+        shm.unlink()
+    return vals
+
+
+def _chi2_pairs_shm(name, shape, dtype, n_levels, pairs):
+    """
+    Worker for `_chi2_pairs_parallel`
+    """
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        codes = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        vals = _chi2_pairs(codes, n_levels, pairs)
+        del codes
+    finally:
+        shm.close()
+    return vals
+
+
+def _pairs_to_matrix(vals, pairs, k):
+    """Symmetric k x k matrix from the values of pairs (i, j)"""
+    Z = np.zeros((k,k))
+    if len(pairs) > 0:
+        i, j = np.array(pairs).T
+        Z[i,j] = Z[j,i] = vals
+    return Z
+
+
+def _sample_size(error, confidence):
+    """
+    Number of records for a margin of error of about 'error' at the
+    'confidence' level, bounding the standard error of Cramers V
+    by that of a correlation, 1 / sqrt(n)
+    """
+    from scipy.stats import norm
+    z = norm.ppf(0.5 + confidence / 2)
+    return int(np.ceil((z / error)**2))
+
+
+def _stratified_sample(df, n, strata, rng):
+    """
+    Sample of about 'n' rows of df without replacement, with each
+    level of the column 'strata' sampled in proportion and with at
+    least one row
+    """
+    if n >= len(df):
+        return df
+    keys = rng.random(len(df))
+    if strata is None:
+        return df.iloc[np.sort(np.argsort(keys)[:n])]
+    s, _ = pd.factorize(df[strata])
+    s = s + 1  # missing values form their own stratum
+    sizes = np.bincount(s)
+    quota = np.maximum(np.round(sizes * n / len(df)), sizes > 0)
+    order = np.lexsort((keys, s))
+    starts = np.cumsum(sizes) - sizes
+    rank = np.empty(len(df), dtype=np.int64)
+    rank[order] = np.arange(len(df)) - starts[s[order]]
+    return df.iloc[np.flatnonzero(rank < quota[s])]
+
+
+def _bootstrap_pairs(codes, n_levels, pairs, n_boot, confidence, rng):
+    """
+    Bootstrap confidence intervals of Cramers V with bias correction
+    of pairs of rows of 'codes'
+
+    The replicates of a pair are multinomial draws from its contingency
+    table, over the cells that are not empty, which is equivalent to
+    resampling the records. All replicates of a pair are evaluated in
+    one batch
+
+    Returns
+    -------
+    lower, upper : 1-D numpy arrays with one bound per pair
+    """
+    alpha = (1 - confidence) / 2
+    lower = np.full(len(pairs), np.nan)
+    upper = np.full(len(pairs), np.nan)
+    for m, (i,j) in enumerate(pairs):
+        t = _contingency(codes[i], n_levels[i], codes[j], n_levels[j])
+        if hasattr(t, 'tocoo'):
+            t = t.tocoo()
+            row, col, cnt = t.row, t.col, t.data
+        else:
+            t = t[t.any(axis=1)][:, t.any(axis=0)]
+            if t.shape == (2, 2):
+                # keep the empty cells for Yates' correction
+                row, col = np.divmod(np.arange(4), 2)
+                cnt = t.ravel()
+            else:
+                row, col = np.nonzero(t)
+                cnt = t[row, col]
+        n = cnt.sum()
+        if n < 2:
+            continue
+        u0 = _phi2_corrected(*_table_stats(t))
+        u = _bootstrap_tables(row, col, cnt, n_boot, rng)
+        # resampling inflates the statistic, so the quantiles are shifted
+        # by the bootstrap estimate of that bias. This is done on the
+        # squared statistic, which unlike the statistic is not bounded
+        # at zero
+        q = np.nanquantile(u, [alpha, 1 - alpha]) - (np.nanmedian(u) - u0)
+        lower[m], upper[m] = np.sqrt(np.clip(q, 0, 1))
+    return lower, upper
+
+
+def _bootstrap_tables(row, col, cnt, n_boot, rng):
+    """
+    Squared Cramers V with bias correction, before negative values are
+    set to zero, of 'n_boot' multinomial replicates of the contingency
+    table with counts 'cnt' in cells (row, col)
+    """
+    n = cnt.sum()
+    T = rng.multinomial(n, cnt / n, size=n_boot).astype(float)
+    r, k = row.max() + 1, col.max() + 1
+    B = np.arange(n_boot)[:, None]
+    a = np.bincount((B * r + row).ravel(), weights=T.ravel(),
+                    minlength=n_boot * r).reshape(n_boot, r)
+    b = np.bincount((B * k + col).ravel(), weights=T.ravel(),
+                    minlength=n_boot * k).reshape(n_boot, k)
+    rb, kb = (a > 0).sum(axis=1), (b > 0).sum(axis=1)
+    E = a[:, row] * b[:, col] / n
+    d = T - E
+    if len(cnt) == 4 and r == 2 and k == 2:
+        yates = ((rb == 2) & (kb == 2))[:, None]
+        d = np.where(yates, np.sign(d) * np.maximum(np.abs(d) - 0.5, 0), d)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        chi2 = np.where(E > 0, d * d / E, 0).sum(axis=1) + (n - E.sum(axis=1))
+    return _phi2_corrected(np.maximum(chi2, 0), n, rb, kb)
+
+
+def _pearson(X):
+    """
+    Pearson correlation matrix of the columns of the 2-D array X,
+    ignoring missing values pairwise
+
+    Without missing values, the columns are standardized and the
+    matrix is one product. Otherwise the pairwise counts, sums and
+    sums of squares are also products of the masks of present values
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        X = X - np.nanmean(X, axis=0)
+        present = ~np.isnan(X)
+        if present.all():
+            X = X / np.sqrt((X**2).sum(axis=0))
+            R = X.T @ X
+        else:
+            M = present.astype(float)
+            X = np.where(present, X, 0)
+            n = M.T @ M
+            sx = X.T @ M
+            sxx = (X**2).T @ M
+            cov = n * (X.T @ X) - sx * sx.T
+            R = cov / np.sqrt((n * sxx - sx**2) * (n * sxx - sx**2).T)
+    np.fill_diagonal(R, np.where(np.isnan(np.diag(R)), np.nan, 1))
+    return np.clip(R, -1, 1)
+
+
+def _correlation_ratio(codes, n_levels, X):
+    """
+    Correlation ratio (eta) of each numeric column of X with each
+    column of integer codes, ignoring records where either is missing
+
+    Returns
+    -------
+    2-D numpy array with one row per column of codes and one column
+    per column of X
+    """
+    eta = np.empty((len(codes), X.shape[1]))
+    X = X - np.nanmean(X, axis=0)
+    present = ~np.isnan(X)
+    for i, c in enumerate(codes):
+        for j in range(X.shape[1]):
+            ok = (c >= 0) & present[:, j]
+            cj, x = c[ok], X[ok, j]
+            cnt = np.bincount(cj, minlength=n_levels[i])
+            s = np.bincount(cj, weights=x, minlength=n_levels[i])
+            total = x.sum()
+            with np.errstate(divide='ignore', invalid='ignore'):
+                ssb = (s[cnt > 0]**2 / cnt[cnt > 0]).sum() - total**2 / len(x)
+                sst = (x**2).sum() - total**2 / len(x)
+                eta[i, j] = np.sqrt(np.clip(ssb / sst, 0, 1))
+    return eta
+
+
+def _agreement_sketch(codes, n_levels, m, rng):
+    """
+    Sketch of each column of integer codes on 'm' random pairs of
+    distinct records (p, q): 1 / frequency of the level of p if p and
+    q agree, and 0 otherwise. Missing values are treated as a level
+
+    The mean product of the sketches of two columns estimates
+    1 + chi2 / n of their contingency table
+
+    Returns
+    -------
+    sketch : 2-D numpy array of float32 with one column per column of codes
+
+    n_sketch_levels : 1-D numpy array with the number of levels of each
+        column, including missing values
+    """
+    n = codes.shape[1]
+    p = rng.integers(0, n, m)
+    q = (p + rng.integers(1, n, m)) % n
+    U = np.zeros((m, len(codes)), dtype=np.float32)
+    n_sketch_levels = np.empty(len(codes), dtype=np.int64)
+    for i, c in enumerate(codes):
+        c = np.where(c < 0, n_levels[i], c)
+        cnt = np.bincount(c, minlength=n_levels[i] + 1)
+        n_sketch_levels[i] = np.count_nonzero(cnt)
+        a, agree = c[p], c[p] == c[q]
+        U[agree, i] = n / cnt[a[agree]]
+    return U, n_sketch_levels
+
+
+def _screen_pairs(codes, n_levels, k, threshold, m, confidence, rng):
+    """
+    Pairs (i, j), i < j, of columns of integer codes whose Cramers V
+    with bias correction may be at least 'threshold', or in the top
+    'k' of either column, according to confidence bounds from an
+    agreement sketch of 'm' pairs of records
+    """
+    from scipy.stats import norm
+    n, K = codes.shape[1], len(codes)
+    if n < 2 or K < 2:
+        return np.empty((0, 2), dtype=np.int64)
+    U, L = _agreement_sketch(codes, n_levels, m, rng)
+    U2 = U**2
+    z = norm.ppf(0.5 + confidence / 2)
+    # variance of the products of independent columns, a floor for the
+    # estimate which misses rare levels
+    var_floor = (L[:, None] * L[None, :] - 1).astype(float)
+    block = max(1, _MAX_DENSE_CELLS // K)
+    candidates = []
+    for start in range(0, K, block):
+        rows = np.arange(start, min(start + block, K))
+        S = (U[:, rows].T @ U).astype(float) / m
+        Q = (U2[:, rows].T @ U2).astype(float) / m
+        se = np.sqrt(np.maximum(Q - S**2, var_floor[rows]) / m)
+        r, c = n_levels[rows, None], n_levels[None, :]
+        with np.errstate(invalid='ignore'):
+            upper = _cramers_corrected(n * (S - 1 + z * se), n, r, c)
+            lower = _cramers_corrected(n * (S - 1 - z * se), n, r, c)
+        upper = np.where(np.isnan(upper), -np.inf, upper)
+        lower = np.where(np.isnan(lower), -np.inf, lower)
+        lower[np.arange(len(rows)), rows] = -np.inf
+        bound = np.full(len(rows), -np.inf)
+        if threshold is not None:
+            bound[:] = threshold
+        if k is not None and k < K - 1:
+            # a partner cannot be in the top k if k others are surely stronger
+            kth = -np.partition(-lower, k - 1, axis=1)[:, k - 1]
+            bound = np.maximum(bound, kth)
+        i, j = np.nonzero(upper >= bound[:, None])
+        i, j = rows[i][rows[i] != j], j[rows[i] != j]
+        candidates.append(np.column_stack([np.minimum(i, j), np.maximum(i, j)]))
+    return np.unique(np.concatenate(candidates), axis=0)
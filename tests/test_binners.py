@@ -1,3 +1,4 @@
+import sys
 import pytest
 import pandas as pd
 import numpy as np
@@ -9,8 +10,17 @@ from dsutils.utils.binners import (
     human_readable_num,
     cutter,
     binner_df,
+    cutter_many,
+    binner_df_many,
+    QuantileSketch,
+    ColumnSummary,
+    _point_mass,
     _log_spcl,
-    _order_of_mag
+    _order_of_mag,
+    _orders_of_mag,
+    _human_readable_nums,
+    _label_constructor,
+    _remove_closest
 )
 
 def test_cutpoints():
@@ -23,6 +33,18 @@ def test_human_readable_num():
     assert human_readable_num(20.321) == '20.3'
     assert human_readable_num(20321) == '20.3K'
 
+def test_human_readable_nums():
+    x = np.array([20.321, 20321, 0, -0.5, 0.00123, 1e-15, 1e-7, 999.5,
+                  123456789, 1e21, -4e17, np.nan, 1, 100, 0.1])
+    z = _human_readable_nums(x)
+    assert z.tolist() == [human_readable_num(i) for i in x]
+    assert _orders_of_mag(x[:-4]).tolist() == [_order_of_mag(i) for i in x[:-4]]
+
+def test_label_constructor():
+    b, p = _label_constructor(np.array([-0.5, 0, 1, 2.98, 3.1]), np.array([0, 1]))
+    assert b == ['01: [-0.5, 0)', '03: (0, 1)', '05: (1, 2.98]', '06: (2.98, 3.1]']
+    assert p == ['02: 0', '04: 1']
+
 
 @pytest.fixture
 def example_data():
@@ -63,4 +85,83 @@ def test_log_spcl():
 
 def test_order_of_mag():
     assert _order_of_mag(0) == 0
-    assert _order_of_mag(123456) == 5
\ No newline at end of file
+    assert _order_of_mag(123456) == 5
+
+def test_cutter_codes(example_data, example_data_binned):
+    df = pd.concat([example_data, pd.DataFrame({'x':[np.nan]})], ignore_index=True)
+    x = cutter(df,'x',3)
+    assert x.codes.dtype == np.int8
+    assert x.codes[-1] == -1
+    assert x.codes[:-1].tolist() == example_data_binned.codes.tolist()
+
+
+def test_cutter_many(example_data, example_data_binned):
+    df = example_data.assign(y = lambda z: z.x * 1000)
+    z = cutter_many(df, max_levels=3)
+    assert z.columns.tolist() == ['x', 'y']
+    assert pd.Series(z.x.values).equals(pd.Series(example_data_binned))
+    assert z.y.tolist() == cutter(df,'y',3).tolist()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="requires shared_memory")
+def test_cutter_many_n_jobs(example_data):
+    df = example_data.assign(y = lambda z: z.x * 1000)
+    assert cutter_many(df, max_levels=3, n_jobs=2).equals(
+        cutter_many(df, max_levels=3))
+
+
+def test_binner_df_many(example_data):
+    df = pd.concat([example_data, pd.DataFrame({'x':[np.nan]})], ignore_index=True)
+    z = binner_df_many(df, ['x'], ['wz'], max_levels=3)
+    assert z.columns.tolist() == ['x', 'wz']
+    assert z.wz.iloc[-1] == 'MISSING'
+
+
+def test_quantile_sketch_exact(example_data, example_data_binned):
+    sk = QuantileSketch().update(example_data.x.values)
+    assert np.array_equal(
+        cutpoints(sk, ncuts=3), cutpoints(example_data.x.values, ncuts=3))
+    x = pd.Series(cutter(example_data, 'x', 3, sketch=sk))
+    assert x.equals(pd.Series(example_data_binned))
+
+
+def test_quantile_sketch_merge():
+    x = np.random.default_rng(0).normal(size=100000)
+    a = QuantileSketch(seed=0).update(x[:50000])
+    b = QuantileSketch(seed=1).update(x[50000:])
+    a.merge(b)
+    assert a.n == len(x)
+    assert len(np.concatenate(a._levels)) < 1000
+    assert a.min() == x.min() and a.max() == x.max()
+    q = np.linspace(0.05, 0.95, 19)
+    ranks = np.searchsorted(np.sort(x), a.quantile(q)) / len(x)
+    assert np.abs(ranks - q).max() < 0.02
+
+
+def test_column_summary(example_data, example_data_binned):
+    x = example_data.x.values
+    cs = ColumnSummary(np.append(x, np.nan))
+    assert cs.n_nan == 1 and cs.min() == -0.5 and cs.max() == 3.1
+    assert np.array_equal(cs.quantile([0.025, 0.5, 0.975]),
+                          np.quantile(x, [0.025, 0.5, 0.975]))
+    assert np.array_equal(_point_mass(cs), _point_mass(example_data.x))
+    assert np.array_equal(cutpoints(cs, ncuts=3), cutpoints(x, ncuts=3))
+    z = pd.Series(cutter(example_data, 'x', 3, sketch=cs))
+    assert z.equals(pd.Series(example_data_binned))
+
+
+def test_remove_closest():
+    x = np.array([0., 1, 2, 3, 4, 5])
+    assert _remove_closest(x, np.array([0.1, 2.5, 4.9])).tolist() == [0, 3, 5]
+    assert _remove_closest(x, np.array([0.1]), exclude_endpoints=False).tolist() == [1, 2, 3, 4, 5]
+    assert _remove_closest(x[:2], np.array([0.1])).tolist() == [0, 1]
+
+
+def test_binner_df_modes(example_data):
+    df = pd.concat([example_data, pd.DataFrame({'x':[np.nan]})], ignore_index=True)
+    z = binner_df(df, 'x', 'wz', max_levels=3, return_column=True)
+    assert z.name == 'wz' and z.iloc[-1] == 'MISSING'
+    assert z.cat.categories[-1] == 'MISSING'
+    assert df.columns.tolist() == ['x']
+    assert binner_df(df, 'x', 'wz', max_levels=3, inplace=True) is None
+    assert df.wz.equals(z)
@@ -0,0 +1,67 @@
+"""
+Test memoization of binning and histogram results
+"""
+
+import pickle
+import pytest
+import numpy as np
+import pandas as pd
+from dsutils.utils import cache
+from dsutils.utils.binners import cutter
+from dsutils.utils.histograms import _numeric_histogram, _categorical_histogram
+
+@pytest.fixture
+def example_data():
+    """Data for test"""
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame({
+        'x': rng.lognormal(size=1000),
+        'y': rng.normal(size=1000),
+        'z': rng.choice(list('abcdef'), size=1000)})
+    return df
+
+@pytest.fixture
+def result_cache(tmp_path):
+    """Cache that is disabled after the test"""
+    yield cache.enable_cache(path=str(tmp_path))
+    cache.disable_cache()
+
+def test_cache(example_data, result_cache):
+    expected = _numeric_histogram(example_data, 'x', 'y', max_levels=5)
+    assert result_cache.misses == 2
+    p = _numeric_histogram(example_data, 'x', 'y', max_levels=5)
+    assert result_cache.hits == 1
+    pd.testing.assert_frame_equal(p, expected)
+    # the cached frame is not modified through the returned copy
+    p['_PERCENT_'] = 1
+    pd.testing.assert_frame_equal(
+        _numeric_histogram(example_data, 'x', 'y', max_levels=5), expected)
+    # the bins fitted for the histogram are reused by cutter
+    z = cutter(example_data, 'x', max_levels=5)
+    assert result_cache.hits == 3
+    # any change of the data or the parameters is a miss
+    _numeric_histogram(example_data.assign(y=example_data.y + 1), 'x', 'y', max_levels=5)
+    _categorical_histogram(example_data, 'z', 'y', max_levels=3)
+    _categorical_histogram(example_data, 'z', 'y', max_levels=4)
+    assert result_cache.info()['misses'] == 5
+    assert result_cache.hits == 4
+    # results are read back from disk after being evicted from memory
+    result_cache._items.clear()
+    assert cutter(example_data, 'x', max_levels=5).equals(z)
+    assert result_cache.hits == 5
+
+def test_cache_eviction(example_data):
+    size = len(pickle.dumps(np.zeros(5), pickle.HIGHEST_PROTOCOL))
+    c = cache.ResultCache(max_bytes=size * 3 // 2)
+    c.put('a', np.zeros(5))
+    c.put('b', np.zeros(5))
+    assert c.get('a') is None
+    assert c.get('b') is not None
+    assert c.info()['evictions'] == 1
+    assert (c.hits, c.misses) == (1, 1)
+
+def test_fingerprint(example_data):
+    f = cache.fingerprint(example_data['z'])
+    assert f == cache.fingerprint(example_data['z'].copy())
+    assert f != cache.fingerprint(example_data['z'].astype('category'))
+    assert f != cache.fingerprint(example_data['z'].iloc[::-1])
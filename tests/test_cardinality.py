@@ -0,0 +1,34 @@
+"""
+Test distinct-count utilities
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from dsutils.utils.cardinality import distinct_count, HyperLogLog
+
+@pytest.fixture
+def example_data():
+    """Data for test"""
+    rng = np.random.RandomState(0)
+    x = pd.Series(rng.randint(0, 1000, size=5000).astype(float))
+    x[::7] = np.nan
+    return x
+
+def test_distinct_count(example_data):
+    n = len(example_data.unique())
+    assert distinct_count(example_data) == n
+    assert distinct_count(example_data, limit=20) == 21
+    assert distinct_count(example_data, limit=n) == n
+    s = pd.Series(['a', None, 'b', 'a'])
+    assert distinct_count(s) == 3
+    assert distinct_count(s.astype('category'), limit=2) == 3
+
+def test_hyperloglog(example_data):
+    n = len(example_data.unique())
+    assert distinct_count(example_data, approx=True) == pytest.approx(n, rel=0.05)
+    a = HyperLogLog(p=14).update(np.arange(50000))
+    b = HyperLogLog(p=14).update(np.arange(25000, 100000))
+    assert a.merge(b).estimate() == pytest.approx(100000, rel=0.05)
+    with pytest.raises(ValueError):
+        a.merge(HyperLogLog(p=12))
@@ -39,4 +39,32 @@ def test_bin_dates(example_data,correct_result):
             .to_frame()
             .assign(dt = lambda df: pd.to_datetime(df.dt)))
 
-    pd.testing.assert_frame_equal(res,correct_result)
\ No newline at end of file
+    pd.testing.assert_frame_equal(res,correct_result)
+
+def test_bin_dates_calendar(example_data):
+    res = bin_dates(example_data.dt, bins='M')
+    assert res.dtype == 'category'
+    assert res.cat.categories[0] == pd.Timestamp('2020-02-15')
+    assert len(res.cat.categories) == 21
+    assert res[9] == pd.Timestamp('2020-02-15')
+    res = bin_dates(example_data.dt, bins='W', midpoints=False)
+    assert res[0] == pd.Interval(
+        pd.Timestamp('2021-03-01'), pd.Timestamp('2021-03-08'), closed='left')
+    res = bin_dates(example_data.dt, bins='Q')
+    assert res[5] == pd.Timestamp('2021-11-16')
+
+
+def test_bin_dates_edges(example_data):
+    res = bin_dates(example_data.dt, bins=5, midpoints=False)
+    expected = pd.cut(example_data.dt, res.cat.categories)
+    assert res.astype(str).equals(expected.astype(str))
+
+
+def test_bin_dates_resolution_and_tz(example_data):
+    expected = bin_dates(example_data.dt, bins=5)
+    res = bin_dates(example_data.dt.values.astype('datetime64[s]'), bins=5)
+    assert list(res) == list(expected)
+    res = bin_dates(example_data.dt.dt.tz_localize('US/Eastern'), bins=5)
+    assert res.equals(expected)
+    res = bin_dates(example_data.dt.dt.tz_localize('US/Eastern'), bins='M')
+    assert res.equals(bin_dates(example_data.dt, bins='M'))
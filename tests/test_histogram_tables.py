@@ -0,0 +1,113 @@
+"""
+Test histogram tables
+"""
+
+import sys
+import subprocess
+import pytest
+import numpy as np
+import pandas as pd
+from dsutils.utils.histograms import _numeric_histogram, _categorical_histogram
+from dsutils.utils.histogram_tables import (
+    numeric_histogram_table,
+    categorical_histogram_table,
+    numeric_histogram_from_files,
+    BinnedSummary
+)
+
+@pytest.fixture
+def example_data():
+    """Data for test"""
+    x = [0, 1, 2.2, 1, 3.1,
+        -0.23, 1, 2.3, 0, -0.5,
+        2, 1.1, np.nan]
+    y = [1.5, 2, np.nan, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13]
+    df = pd.DataFrame({'x':x,'y':y,'z':list('aaaaabbbccdee')})
+    return df
+
+@pytest.mark.parametrize('stat', ['mean', 'sum', 'max', 'std'])
+def test_numeric_histogram_from_files(example_data, tmp_path, stat):
+    path = str(tmp_path / 'example.csv')
+    example_data.iloc[:7].to_csv(path, index=False)
+    example_data.iloc[7:].to_csv(str(tmp_path / 'example2.csv'), index=False)
+    p = numeric_histogram_from_files(
+        [path, str(tmp_path / 'example2.csv')], 'x', 'y',
+        max_levels=3, stat=stat, chunksize=4)
+    pd.testing.assert_frame_equal(
+        p, _numeric_histogram(example_data, 'x', 'y', max_levels=3, stat=stat))
+
+def test_numeric_histogram_from_parquet(example_data, tmp_path):
+    pytest.importorskip('pyarrow')
+    path = str(tmp_path / 'example.parquet')
+    example_data.to_parquet(path)
+    p = numeric_histogram_from_files(path, 'x', max_levels=3, chunksize=5)
+    pd.testing.assert_frame_equal(
+        p, _numeric_histogram(example_data, 'x', max_levels=3))
+
+
+def test_binned_summary_merge(example_data):
+    a = BinnedSummary.fit(example_data, 'x', 'y', max_levels=3)
+    b = BinnedSummary.fit(example_data, 'x', 'y', max_levels=3)
+    a.update(example_data.iloc[:5])
+    b.update(example_data.iloc[5:])
+    p = a.merge(b).to_frame('var')
+    pd.testing.assert_frame_equal(
+        p, _numeric_histogram(example_data, 'x', 'y', max_levels=3, stat='var'))
+
+def test_binned_summary_offset_variance():
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame({
+        'z': rng.choice(list('abc'), size=3000),
+        'y': 1e9 + rng.randn(3000)})
+    a = BinnedSummary('z', levels=['a', 'b', 'c'], oth_columns='y')
+    b = BinnedSummary('z', levels=['a', 'b', 'c'], oth_columns='y')
+    for i in range(0, 2000, 500):
+        a.update(df.iloc[i:i + 500])
+    b.update(df.iloc[2000:])
+    p = a.merge(b).to_frame('var')
+    expected = [np.var(df.loc[df['z'] == z, 'y'], ddof=1) for z in 'abc']
+    np.testing.assert_allclose(p['y'], expected, rtol=1e-6)
+
+def test_binned_summary_categorical(example_data):
+    a = BinnedSummary('z', levels=['a', 'b'], oth_columns='y')
+    b = BinnedSummary('z', levels=['a', 'b'], oth_columns='y')
+    a.update(example_data.iloc[:6])
+    b.update(example_data.iloc[6:])
+    p = a.merge(b).to_frame()
+    pd.testing.assert_frame_equal(
+        p, _categorical_histogram(example_data, 'z', 'y', max_levels=2))
+    with pytest.raises(ValueError):
+        a.merge(BinnedSummary('z', levels=['a'], oth_columns='y'))
+
+
+def test_histogram_tables_typed(example_data):
+    p = numeric_histogram_table(
+        example_data, 'x', 'y', max_levels=5, min_levels=5, normalize=True)
+    expected = _numeric_histogram(example_data, 'x', 'y', max_levels=5)
+    assert p['x'].cat.ordered
+    assert p['x'].astype(str).tolist() == expected['x'].astype(str).tolist()
+    assert p['_COUNT_'].dtype == np.int64
+    assert p['y'].dtype == np.float64
+    assert np.isclose(p['_PERCENT_'].sum(), 1)
+    p = categorical_histogram_table(example_data, 'z', 'y', max_levels=2)
+    assert p['z'].tolist() == ['_OTHER_', 'a', 'b']
+    assert p['_COUNT_'].dtype == np.int64
+
+
+def test_histogram_tables_no_matplotlib():
+    code = (
+        "import sys, dsutils.utils.histogram_tables; "
+        "assert not any(m.startswith('matplotlib') for m in sys.modules)")
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_factorize_levels_crosstab(example_data):
+    from dsutils.utils.histogram_tables import _factorize_levels, _crosstab_codes
+    cz, lz = _factorize_levels(example_data['z'], max_levels=2)
+    assert lz.tolist() == ['a', 'b', '_OTHER_']
+    assert cz.tolist() == [0] * 5 + [1] * 3 + [2] * 5
+    cy, ly = _factorize_levels(example_data['y'] > 5, fillna='MISSING')
+    z = _crosstab_codes(cz, len(lz), cy, len(ly))
+    expected = pd.crosstab(
+        pd.Series(lz[cz]), pd.Series(ly[cy])).loc[lz].values.T
+    assert np.array_equal(z, expected)
@@ -4,9 +4,17 @@ To compile baseline images, run:
 pytest --mpl-generate-path=tests/baseline
 """
 
+import os
 import pytest
+import numpy as np
 import pandas as pd
-from dsutils.utils.histograms import numeric_histogram, categorical_histogram
+from dsutils.utils.histograms import (
+    numeric_histogram,
+    categorical_histogram,
+    histogram_report,
+    plot_bar,
+    BarFigurePool
+)
 
 @pytest.fixture
 def example_data():
@@ -39,4 +47,142 @@ def test_categorical_histogram(example_data):
         line_columns='x',
         max_levels=3,
         normalize=True)
-    return nh
\ No newline at end of file
+    return nh
+
+def test_categorical_histogram_table():
+    from dsutils.utils.histograms import _categorical_histogram
+    df = pd.DataFrame({
+        'y': ['b', 'a', 'c', None, 'b', 'c', 'd', 'a', 'e'],
+        'x': [1, 2, 3, 4, 5, 6, 7, None, 9]})
+    p = _categorical_histogram(df, x='y', oth_columns='x', max_levels=2)
+    assert p['y'].tolist() == ['_OTHER_', 'a', 'b']
+    assert p['_COUNT_'].tolist() == [4, 2, 2]
+    assert p['x'].tolist() == [6.25, 2.0, 3.0]
+    p = _categorical_histogram(df, x='y', oth_columns='x', max_levels=2, stat='median')
+    assert p['x'].tolist() == [6.5, 2.0, 3.0]
+
+@pytest.mark.parametrize('levels', [
+    pd.Series(np.arange(50) % 20),
+    pd.Timestamp('2021-01-01') + pd.to_timedelta(np.arange(50) % 20, 'D')])
+def test_categorical_histogram_table_unorderable(levels):
+    from dsutils.utils.histograms import _categorical_histogram
+    df = pd.DataFrame({'y': levels, 'x': np.arange(50.)})
+    p = _categorical_histogram(df, x='y', oth_columns='x', max_levels=3)
+    assert p['y'].tolist() == [*sorted(levels.unique())[:3], '_OTHER_']
+    assert p['_COUNT_'].tolist() == [3, 3, 3, 41]
+
+def test_categorical_histogram_table_non_numeric():
+    from dsutils.utils.histograms import _categorical_histogram
+    df = pd.DataFrame({
+        'y': ['b', 'a', 'c', None, 'b', 'c', 'd', 'a', 'e'],
+        'x': ['p', 'q', 'o', 'r', 's', 't', 'u', 'v', 'w']})
+    for stat in ['count', 'min', 'max']:
+        p = _categorical_histogram(df, x='y', oth_columns='x', max_levels=2, stat=stat)
+        g = df.assign(y=df['y'].where(df['y'].isin(['a', 'b']) | df['y'].isna(), '_OTHER_'))
+        assert p['x'].tolist() == g.groupby('y')['x'].agg(stat).tolist()
+
+def test_categorical_histogram_table_offset_variance():
+    from dsutils.utils.histograms import _categorical_histogram
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame({
+        'y': rng.choice(list('abc'), size=3000),
+        'x': 1e9 + rng.randn(3000)})
+    for stat in ['var', 'std']:
+        p = _categorical_histogram(df, x='y', oth_columns='x', stat=stat)
+        np.testing.assert_allclose(
+            p['x'], df.groupby('y')['x'].agg(stat).values, rtol=1e-6)
+
+
+@pytest.mark.parametrize('n_jobs', [None, 2])
+def test_histogram_report(example_data, tmp_path, n_jobs):
+    paths = histogram_report(
+        example_data, out_path=str(tmp_path / 'png'), n_jobs=n_jobs)
+    assert [os.path.basename(f) for f in paths] == ['000_x.png', '001_y.png']
+    assert all(os.path.getsize(f) > 0 for f in paths)
+    out = str(tmp_path / 'report.pdf')
+    assert histogram_report(
+        example_data, ['y'], out_path=out, line_columns='x', n_jobs=n_jobs) == [out]
+    with open(out, 'rb') as f:
+        content = f.read()
+    assert content[:4] == b'%PDF'
+    # pages are vector graphics with text, not embedded images
+    assert b'/Font' in content and b'/Subtype /Image' not in content
+
+def test_histogram_report_dates(example_data, tmp_path):
+    df = example_data.assign(
+        d = pd.date_range('2021-01-01', periods=len(example_data), freq='3D'))
+    df.loc[0, 'd'] = pd.NaT
+    paths = histogram_report(
+        df, ['d', 'y'], out_path=str(tmp_path / 'png'), line_columns='x',
+        max_levels=3)
+    assert [os.path.basename(f) for f in paths] == ['000_d.png', '001_y.png']
+    assert all(os.path.getsize(f) > 0 for f in paths)
+
+
+def test_categorical_heatmap(example_data):
+    from dsutils.utils.histograms import categorical_heatmap
+    fig = categorical_heatmap(
+        example_data.assign(z=example_data['x'] > 1), 'y', 'z', max_levels_x=2)
+    labels = [t.get_text() for t in fig.axes[2].get_xticklabels()]
+    assert labels == ['a', 'b', '_OTHER_']
+
+
+def _bar_table(seed):
+    rng = np.random.RandomState(seed)
+    return pd.DataFrame({
+        'x': [f'level {seed}.{i}' for i in range(10)],
+        'y': rng.normal(size=10),
+        '_COUNT_': rng.randint(1, 100, size=10)})
+
+
+def test_bar_figure_pool():
+    p1, p2 = _bar_table(1), _bar_table(2)
+    pool = BarFigurePool()
+    pool.render(p1, 'x', 'y', normalize=True, xlabel='x')
+    # updating the figure in place renders the same image as drawing anew
+    assert pool.render(p2, 'x', 'y', ylabel='y') == \
+        BarFigurePool().render(p2, 'x', 'y', ylabel='y')
+    assert len(pool._figs) == 1
+    p = p1.copy()
+    plot_bar(p, 'x', 'y', normalize=True, pool=pool)
+    pd.testing.assert_frame_equal(p, p1)
+
+
+def test_bar_figure_pool_reuse():
+    pool = BarFigurePool()
+    fig = pool.figure(_bar_table(1), 'x', 'y')
+    ax, twinx = fig.axes
+    for seed in [2, 3]:
+        p = _bar_table(seed)
+        assert pool.figure(p, 'x', 'y') is fig
+        assert fig.axes == [ax, twinx]
+        np.testing.assert_array_equal(
+            [r.get_height() for r in ax.patches], p['_COUNT_'])
+        assert [t.get_text() for t in ax.get_xticklabels()] == p['x'].tolist()
+        np.testing.assert_array_equal(twinx.lines[0].get_ydata(), p['y'])
+    # another shape gets its own figure
+    assert pool.figure(_bar_table(1).iloc[:5], 'x', 'y') is not fig
+    assert len(pool._figs) == 2
+
+
+@pytest.mark.skipif(
+    not os.environ.get('DSUTILS_BENCHMARK'),
+    reason='set DSUTILS_BENCHMARK=1 to run benchmarks')
+def test_bar_figure_pool_benchmark():
+    """Report charts rendered per second by pyplot and by the pool"""
+    import io
+    import time
+    import matplotlib.pyplot as plt
+    n = 20
+    t = time.perf_counter()
+    for i in range(n):
+        fig = plot_bar(_bar_table(i), 'x', 'y')
+        fig.savefig(io.BytesIO(), format='png')
+        plt.close(fig)
+    pyplot_rate = n / (time.perf_counter() - t)
+    pool = BarFigurePool()
+    t = time.perf_counter()
+    for i in range(n):
+        pool.render(_bar_table(i), 'x', 'y')
+    pool_rate = n / (time.perf_counter() - t)
+    print(f'charts/sec: pyplot {pyplot_rate:.1f}, pool {pool_rate:.1f}')
@@ -0,0 +1,57 @@
+"""
+Test that importing dsutils modules does not import plotting and
+other heavy dependencies
+"""
+
+import os
+import sys
+import subprocess
+import pytest
+
+HEAVY = [
+    'matplotlib', 'scipy', 'sklearn', 'feature_engine',
+    'dsutils.utils.histograms']
+
+
+def _heavy_imports(module):
+    """Heavy modules in sys.modules after importing 'module' in a fresh interpreter"""
+    code = (
+        f"import sys; import {module}; "
+        f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))")
+    out = subprocess.run(
+        [sys.executable, '-c', code],
+        check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return out.strip()
+
+
+@pytest.mark.parametrize('module', [
+    'dsutils.monitoring.psi',
+    'dsutils.utils.binners',
+    'dsutils.utils.histogram_tables',
+    'dsutils.transformers'])
+def test_lazy_imports(module):
+    assert _heavy_imports(module) == ''
+
+
+def _import_time(module, repeat=3):
+    """Fastest wall time of importing 'module' in a fresh interpreter"""
+    code = (
+        "import time; t = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - t)")
+    return min(
+        float(subprocess.run(
+            [sys.executable, '-c', code],
+            check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout)
+        for _ in range(repeat))
+
+
+@pytest.mark.skipif(
+    not os.environ.get('DSUTILS_BENCHMARK'),
+    reason='set DSUTILS_BENCHMARK=1 to run benchmarks')
+def test_import_time_benchmark():
+    """Report the import time of dsutils modules and of numpy and pandas"""
+    for module in [
+            'numpy, pandas', 'dsutils.monitoring.psi', 'dsutils.utils.binners',
+            'dsutils.utils.histogram_tables', 'dsutils.transformers',
+            'dsutils.utils.histograms']:
+        print(f'{module}: {_import_time(module):.3f}s')
@@ -0,0 +1,28 @@
+import pytest
+import pandas as pd
+import numpy as np
+
+from dsutils.transformers._numeric_binners import NumericBinner
+from dsutils.utils.binners import cutter
+
+@pytest.fixture
+def example_data():
+    return(pd.DataFrame(
+    {'x':[0, 1, 2.2, 1, 3.1, -0.23, 1, 2.3, 0, -0.5, 2, 1.1],
+     'y':np.linspace(-10,45,12)}
+    ))
+
+def test_numeric_binner(example_data):
+    nb = NumericBinner(variables = ['x','y'], max_levels = 3)
+    ft = nb.fit_transform(example_data)
+    for z in ['x','y']:
+        c = cutter(example_data, z, 3)
+        assert ft[z].tolist() == c.tolist()
+        assert ft[z].cat.categories.equals(c.categories)
+
+def test_numeric_binner_new_data(example_data):
+    nb = NumericBinner(variables = 'x', max_levels = 3).fit(example_data)
+    res = nb.transform(pd.DataFrame({'x':[1, 0.5, np.nan, 100, -0.5]}))
+    assert res.x.tolist()[:2] == ['04: 1', '03: (0, 1)']
+    assert res.x.isna().tolist() == [False, False, True, True, False]
+    assert res.x.cat.categories.tolist() == nb.map['x']['labels']
@@ -4,6 +4,7 @@ import pandas as pd
 import numpy as np
 
 from dsutils.monitoring.psi import PSI
+from dsutils.utils.binners import ColumnSummary
 
 
 def test_PSI():
@@ -17,4 +18,14 @@ def test_PSI():
     psi.fit(df1)
     res = psi.transform(df2)
     res = {k:round(v,5) for k,v in res.items()}
-    assert res == {'x': 0.00041, 'y': 4.4372}
\ No newline at end of file
+    assert res == {'x': 0.00041, 'y': 4.4372}
+
+
+def test_PSI_summaries():
+    df1 = pd.DataFrame({'x' : [0, 0, 1, 2, 2, 2, np.nan]})
+    df2 = pd.DataFrame({'x' : [0, 1, 1, 2, np.nan, np.nan]})
+    psi = PSI()
+    psi.fit(df1)
+    res = psi.transform(df2)
+    psi.fit(df1, summaries = {'x' : ColumnSummary(df1.x)})
+    assert psi.transform(df2) == res
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+Test association statistics
+"""
+
+import sys
+import pytest
+import numpy as np
+import pandas as pd
+import scipy.stats as ss
+from dsutils.utils.stats import (
+    cramers_corrected_stat,
+    cramers_corrected_matrix,
+    cramers_v,
+    cramers_v_many,
+    association_matrix,
+    top_associations
+)
+
+@pytest.fixture
+def example_data():
+    """Data for test"""
+    rng = np.random.RandomState(0)
+    n = 500
+    df = pd.DataFrame({
+        'a': rng.choice(list('abcd'), size=n),
+        'b': rng.choice(list('xy'), size=n),
+        'c': rng.choice(list('pqrst'), size=n)})
+    df['d'] = np.where(rng.rand(n) < 0.5, df['a'], 'z')
+    df.loc[rng.rand(n) < 0.1, 'a'] = None
+    df['e'] = np.where(rng.rand(n) < 0.7, df['b'], 'w')
+    return df
+
+def _reference(t):
+    """Cramers V with bias correction, with scipy's chi-square statistic"""
+    chi2 = ss.chi2_contingency(t)[0]
+    n = t.sum()
+    r, k = t.shape
+    phi2corr = max(0, chi2 / n - ((k-1)*(r-1))/(n-1))
+    rcorr = r - ((r-1)**2)/(n-1)
+    kcorr = k - ((k-1)**2)/(n-1)
+    return np.sqrt(phi2corr / min(kcorr-1, rcorr-1))
+
+def test_cramers_corrected_stat(example_data):
+    for x, y in [('a', 'c'), ('a', 'd'), ('b', 'e')]:
+        t = pd.crosstab(example_data[x], example_data[y]).values
+        assert cramers_corrected_stat(t) == pytest.approx(_reference(t))
+
+@pytest.mark.parametrize('n_jobs', [
+    None,
+    pytest.param(2, marks=pytest.mark.skipif(
+        sys.version_info < (3, 8), reason="requires shared_memory"))])
+def test_cramers_corrected_matrix(example_data, n_jobs):
+    Z = cramers_corrected_matrix(example_data, n_jobs=n_jobs)
+    assert sorted(Z.index) == list('abcde')
+    for x in Z.index:
+        for y in Z.columns:
+            t = pd.crosstab(example_data[x], example_data[y]).values
+            assert Z.loc[x, y] == pytest.approx(_reference(t))
+
+@pytest.mark.parametrize('n_jobs', [
+    None,
+    pytest.param(2, marks=pytest.mark.skipif(
+        sys.version_info < (3, 8), reason="requires shared_memory"))])
+def test_cramers_v_many(example_data, n_jobs):
+    z = cramers_v_many(example_data, y='a', n_jobs=n_jobs)
+    assert z.index.tolist()[0] == 'd'
+    assert z.is_monotonic_decreasing
+    for x in z.index:
+        t = pd.crosstab(example_data[x], example_data['a']).values
+        assert z[x] == pytest.approx(_reference(t))
+    assert np.allclose(cramers_v(example_data, ['b', 'c'], 'a'), z[['b', 'c']])
+
+def test_cramers_sparse(example_data, monkeypatch):
+    import dsutils.utils.stats
+    expected = cramers_corrected_matrix(example_data)
+    monkeypatch.setattr(dsutils.utils.stats, '_MAX_DENSE_CELLS', 0)
+    pd.testing.assert_frame_equal(cramers_corrected_matrix(example_data), expected)
+    from scipy.sparse import coo_matrix
+    t = pd.crosstab(example_data['a'], example_data['c']).values
+    assert cramers_corrected_stat(coo_matrix(t)) == pytest.approx(_reference(t))
+    # a 2x2 table observed in a huge sparse one is not densified whole
+    big = coo_matrix(
+        ([30, 10, 5, 25], ([7, 7, 99998, 99998], [3, 99999, 3, 99999])),
+        shape=(100000, 100000))
+    t = np.array([[30, 10], [5, 25]])
+    assert cramers_corrected_stat(big) == pytest.approx(_reference(t))
+
+def test_cramers_approx(example_data):
+    """Test sampled matrix with bootstrap confidence intervals"""
+    Z = cramers_corrected_matrix(example_data, reorder_cuthill_mckee=False)
+    A, lower, upper, flagged = cramers_corrected_matrix(
+        example_data, reorder_cuthill_mckee=False, approx=True, error=0.1,
+        threshold=0.1, strata='b', random_state=0)
+    assert A.index.equals(Z.index) and lower.columns.equals(Z.columns)
+    assert (lower.values <= A.values + 1e-12).all()
+    assert (A.values <= upper.values + 1e-12).all()
+    assert lower.loc['b', 'e'] <= Z.loc['b', 'e'] <= upper.loc['b', 'e']
+    for x, y in flagged:
+        assert x < y
+        assert lower.loc[x, y] <= 0.1 <= upper.loc[x, y]
+
+def test_association_matrix(example_data):
+    """Test mixed type associations against pandas and cramers_corrected_matrix"""
+    df = example_data.copy()
+    rng = np.random.RandomState(1)
+    df['x'] = rng.randn(len(df))
+    df['y'] = df['x'] + df['b'].map({'x': 0., 'y': 1.}) + rng.randn(len(df))
+    df.loc[rng.rand(len(df)) < 0.1, 'y'] = np.nan
+    Z = association_matrix(df, reorder_cuthill_mckee=False)
+    cat = list('abcde')
+    np.testing.assert_allclose(Z.loc[cat, cat],
+        cramers_corrected_matrix(df[cat], reorder_cuthill_mckee=False))
+    np.testing.assert_allclose(Z.loc[['x', 'y'], ['x', 'y']], df[['x', 'y']].corr())
+    d = df[['b', 'y']].dropna()
+    m = d.groupby('b')['y'].transform('mean')
+    eta = np.sqrt(((m - d['y'].mean())**2).sum() / ((d['y'] - d['y'].mean())**2).sum())
+    assert np.isclose(Z.loc['b', 'y'], eta) and np.isclose(Z.loc['y', 'b'], eta)
+    assert sorted(association_matrix(df).columns) == sorted(df.columns)
+
+@pytest.mark.parametrize('k,threshold', [(2, None), (None, 0.3), (1, 0.05)])
+def test_top_associations(example_data, k, threshold):
+    """Test top pairs against the full matrix"""
+    Z = cramers_corrected_matrix(example_data, reorder_cuthill_mckee=False)
+    expected = set()
+    for x in Z.columns:
+        z = Z[x].drop(x).sort_values(ascending=False, kind='mergesort')
+        if threshold is not None:
+            z = z[z >= threshold]
+        if k is not None:
+            z = z[:k]
+        expected |= {frozenset((x, y)) for y in z.index}
+    e = top_associations(example_data, k=k, threshold=threshold, random_state=0)
+    assert set(frozenset(p) for p in zip(e['x'], e['y'])) == expected
+    assert (np.diff(e['cramers_v']) <= 0).all()
+    for x, y, v in e.itertuples(index=False):
+        assert np.isclose(Z.loc[x, y], v)